@@ -4,7 +4,7 @@ Chess board detection module for chess video analyzer.
 
 import cv2
 import numpy as np
-from typing import List, Optional, Tuple
+from typing import Optional, Tuple
 
 
 class BoardDetector:
@@ -12,77 +12,310 @@ class BoardDetector:
     Detects chess boards in video frames.
     """
 
-    def __init__(self, min_board_size: float = 0.2, max_board_size: float = 0.9):
+    # Corners of the unit square (top-left, top-right, bottom-right, bottom-left)
+    _UNIT_SQUARE = np.array([[0, 0], [1, 0], [1, 1], [0, 1]], dtype=np.float32)
+
+    def __init__(
+        self,
+        min_board_size: float = 0.2,
+        max_board_size: float = 0.9,
+        roi_padding: float = 0.1,
+        roi_area_tolerance: float = 0.2,
+        pyramid_levels: int = 1,
+        use_opencl: bool = True,
+        use_cuda: bool = False,
+        static_threshold: float = 2.0,
+    ):
         """
         Initialize the board detector.
 
         Args:
             min_board_size: Minimum board size as a fraction of frame size
             max_board_size: Maximum board size as a fraction of frame size
+            roi_padding: Padding around the last detected board, as a fraction of
+                its size, used when searching for the board in the next frame
+            roi_area_tolerance: Maximum relative area change for a board found
+                around the last detection to be accepted
+            pyramid_levels: Number of times the frame is halved before searching
+                the full frame (0 searches at full resolution)
+            use_opencl: Run thresholding through OpenCL (cv2.UMat) when available
+            use_cuda: Run the board perspective warp on a CUDA device when available
+            static_threshold: Mean absolute difference of 32x32 frame thumbnails
+                below which a frame is treated as unchanged and the last detected
+                board is reused (0 disables)
         """
         self.min_board_size = min_board_size
         self.max_board_size = max_board_size
+        self.roi_padding = roi_padding
+        self.roi_area_tolerance = roi_area_tolerance
+        self.pyramid_levels = pyramid_levels
+        self.use_opencl = use_opencl and cv2.ocl.haveOpenCL()
+        self.use_cuda = use_cuda and self._have_cuda()
+        self.static_threshold = static_threshold
         self.last_board_contour = None  # Cache the last detected board contour
+        self._signature = None  # Thumbnail of the frame the board was detected in
+        self._grid_cache = {}  # Grid cell arrays keyed by cell size
+        self._warp_cache = None  # (contour bytes, inverse warp matrix, board size)
+        self._gpu_frame = None  # Device buffers reused by the CUDA warp
+        self._gpu_board = None
 
-    def detect_board(self, frame: np.ndarray) -> Optional[np.ndarray]:
+    def detect_board(
+        self, frame: np.ndarray, gray: Optional[np.ndarray] = None
+    ) -> Optional[np.ndarray]:
         """
         Detect a chess board in the given frame.
 
+        When a board was found in a previous frame, the search is first restricted
+        to a padded region around it and only falls back to the full frame if the
+        board cannot be verified there. Frames that are nearly identical to the
+        frame of the last detection reuse the last detected board.
+
         Args:
             frame: Input frame
+            gray: Grayscale version of the frame, if already computed by the caller
 
         Returns:
             Optional[np.ndarray]: Contour of the detected board or None if not found
         """
-        # Convert to grayscale if needed
-        if len(frame.shape) == 3:
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = frame.copy()
-
-        # Apply adaptive thresholding
-        thresh = cv2.adaptiveThreshold(
-            gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
-        )
+        # Reuse the last board if the frame has not changed noticeably
+        signature = self._frame_signature(frame if gray is None else gray)
+        if (
+            self.last_board_contour is not None
+            and self._signature is not None
+            and self._signature.shape == signature.shape
+            and np.mean(cv2.absdiff(signature, self._signature)) < self.static_threshold
+        ):
+            return self.last_board_contour
+        self._signature = signature
 
-        # Find contours
-        contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        
-        # Sort contours by area (largest first)
-        contours = sorted(contours, key=cv2.contourArea, reverse=True)
-        
         # Get frame dimensions
         height, width = frame.shape[:2]
         min_area = height * width * self.min_board_size * self.min_board_size
         max_area = height * width * self.max_board_size * self.max_board_size
+
+        # Try the region around the last detected board first
+        if self.last_board_contour is not None:
+            approx = self._detect_board_in_roi(frame, gray, min_area, max_area)
+            if approx is not None:
+                self.last_board_contour = approx
+                return approx
+
+        # Fall back to searching the full frame
+        approx = self._detect_board_full(frame, gray, min_area, max_area)
+        if approx is not None:
+            self.last_board_contour = approx
+            return approx
+
+        # If no board found, return the last detected board if available
+        return self.last_board_contour
+
+    def reset(self) -> None:
+        """
+        Forget the last detected board, so that the next frame is searched in full.
+        """
+        self.last_board_contour = None
+        self._signature = None
+
+    def _detect_board_full(
+        self,
+        frame: np.ndarray,
+        gray: Optional[np.ndarray],
+        min_area: float,
+        max_area: float,
+    ) -> Optional[np.ndarray]:
+        """
+        Detect the board in the full frame using a downsampled pyramid level.
+
+        The board is located on the downsampled image, then its corners are scaled
+        back and refined on the full-resolution image.
+
+        Args:
+            frame: Input frame
+            gray: Grayscale version of the frame or None
+            min_area: Minimum board contour area
+            max_area: Maximum board contour area
+
+        Returns:
+            Optional[np.ndarray]: Board contour in frame coordinates or None if not
+            found
+        """
+        if gray is None:
+            gray = self._to_gray(frame)
+        if self.pyramid_levels <= 0:
+            return self._find_board_contour(gray, min_area, max_area)
+
+        small = gray
+        for _ in range(self.pyramid_levels):
+            small = cv2.pyrDown(small)
+
+        scale = 2 ** self.pyramid_levels
+        area_scale = scale * scale
+        approx = self._find_board_contour(
+            small, min_area / area_scale, max_area / area_scale
+        )
+        if approx is None:
+            return None
+
+        # Scale the corners back up and refine them at full resolution
+        corners = approx.astype(np.float32) * scale
+        criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 20, 0.1)
+        corners = cv2.cornerSubPix(gray, corners, (5, 5), (-1, -1), criteria)
+
+        return np.rint(corners).astype(approx.dtype)
+
+    def _detect_board_in_roi(
+        self,
+        frame: np.ndarray,
+        gray: Optional[np.ndarray],
+        min_area: float,
+        max_area: float,
+    ) -> Optional[np.ndarray]:
+        """
+        Detect the board inside a padded region around the last detected board.
+
+        Args:
+            frame: Input frame
+            gray: Grayscale version of the frame or None
+            min_area: Minimum board contour area
+            max_area: Maximum board contour area
+
+        Returns:
+            Optional[np.ndarray]: Board contour in frame coordinates or None if the
+            board could not be verified inside the region
+        """
+        height, width = frame.shape[:2]
+        x, y, w, h = cv2.boundingRect(self.last_board_contour)
+
+        # Pad the bounding box and clip it to the frame
+        pad_x = int(w * self.roi_padding)
+        pad_y = int(h * self.roi_padding)
+        x0 = max(0, x - pad_x)
+        y0 = max(0, y - pad_y)
+        x1 = min(width, x + w + pad_x)
+        y1 = min(height, y + h + pad_y)
+
+        # Only the region needs converting when no grayscale frame was given
+        source = gray if gray is not None else frame
+        roi = source[y0:y1, x0:x1]
+        approx = self._find_board_contour(self._to_gray(roi), min_area, max_area)
+        if approx is None:
+            return None
+
+        # Verify the board has not changed size significantly
+        prev_area = cv2.contourArea(self.last_board_contour)
+        area = cv2.contourArea(approx)
+        if prev_area <= 0 or abs(area / prev_area - 1.0) > self.roi_area_tolerance:
+            return None
+
+        # Translate the contour back to frame coordinates
+        return approx + np.array([x0, y0], dtype=approx.dtype)
+
+    @staticmethod
+    def _frame_signature(img: np.ndarray) -> np.ndarray:
+        """
+        Compute a small grayscale thumbnail used to detect unchanged frames.
+
+        Args:
+            img: Input frame (color or grayscale)
+
+        Returns:
+            np.ndarray: 32x32 grayscale thumbnail
+        """
+        # Sparse bilinear sampling is enough to notice camera or board movement
+        thumbnail = cv2.resize(img, (32, 32), interpolation=cv2.INTER_LINEAR)
+        if len(thumbnail.shape) == 3:
+            thumbnail = cv2.cvtColor(thumbnail, cv2.COLOR_BGR2GRAY)
+        return thumbnail
+
+    @staticmethod
+    def _have_cuda() -> bool:
+        """
+        Check whether OpenCV was built with CUDA image warping and a device exists.
+
+        Returns:
+            bool: True if cv2.cuda.warpPerspective can be used, False otherwise
+        """
+        cuda = getattr(cv2, "cuda", None)
+        if cuda is None or not hasattr(cuda, "warpPerspective"):
+            return False
+        try:
+            return cuda.getCudaEnabledDeviceCount() > 0
+        except cv2.error:
+            return False
+
+    @staticmethod
+    def _to_gray(img: np.ndarray) -> np.ndarray:
+        """
+        Convert an image to grayscale if needed.
+
+        Args:
+            img: Input image
+
+        Returns:
+            np.ndarray: Grayscale image
+        """
+        if len(img.shape) == 3:
+            return cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        return img
+
+    def _find_board_contour(
+        self, gray: np.ndarray, min_area: float, max_area: float
+    ) -> Optional[np.ndarray]:
+        """
+        Find the largest 4-corner contour within the given area range.
+
+        Args:
+            gray: Grayscale image
+            min_area: Minimum contour area
+            max_area: Maximum contour area
+
+        Returns:
+            Optional[np.ndarray]: Board contour or None if not found
+        """
+        # Apply adaptive thresholding, on the GPU if enabled (findContours needs
+        # the result on the CPU)
+        if self.use_opencl:
+            thresh = cv2.adaptiveThreshold(
+                cv2.UMat(gray), 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
+            ).get()
+        else:
+            thresh = cv2.adaptiveThreshold(
+                gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
+            )
+
+        # Find contours
+        contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
-        # Find the chess board contour
+        # Keep contours within the area range, sorted by area (largest first)
+        candidates = []
         for contour in contours:
             area = cv2.contourArea(contour)
-            
-            # Filter by area
-            if area < min_area or area > max_area:
-                continue
-                
+            if min_area <= area <= max_area:
+                candidates.append((area, contour))
+        candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+        
+        # Find the chess board contour
+        for _, contour in candidates:
             # Approximate the contour
             peri = cv2.arcLength(contour, True)
             approx = cv2.approxPolyDP(contour, 0.02 * peri, True)
             
             # Chess boards are approximately square (4 corners)
             if len(approx) == 4:
-                self.last_board_contour = approx
                 return approx
         
-        # If no board found, return the last detected board if available
-        return self.last_board_contour
+        return None
 
-    def extract_board(self, frame: np.ndarray, contour: np.ndarray) -> Optional[np.ndarray]:
+    def extract_board(
+        self, frame: np.ndarray, contour: np.ndarray, dst: Optional[np.ndarray] = None
+    ) -> Optional[np.ndarray]:
         """
         Extract and normalize the chess board from the frame.
 
         Args:
             frame: Input frame
             contour: Contour of the detected board
+            dst: Optional output image, reused if it has the extracted board's shape
 
         Returns:
             Optional[np.ndarray]: Normalized chess board image or None if extraction fails
@@ -90,36 +323,95 @@ class BoardDetector:
         if contour is None or len(contour) != 4:
             return None
             
+        # The transform only depends on the contour, which is reused as long as
+        # the board does not move
+        key = contour.tobytes()
+        if self._warp_cache is not None and self._warp_cache[0] == key:
+            _, M_inv, max_size = self._warp_cache
+        else:
+            M_inv, max_size = self._board_transform(contour)
+            self._warp_cache = (key, M_inv, max_size)
+        
+        # Apply perspective transform, mapping output pixels back to the frame
+        flags = cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP
+        if self.use_cuda:
+            warped = self._warp_cuda(frame, M_inv, max_size, dst, flags)
+        else:
+            warped = cv2.warpPerspective(
+                frame, M_inv, (max_size, max_size), dst=dst, flags=flags
+            )
+        
+        return warped
+
+    def _warp_cuda(
+        self,
+        frame: np.ndarray,
+        M_inv: np.ndarray,
+        max_size: int,
+        dst: Optional[np.ndarray],
+        flags: int,
+    ) -> np.ndarray:
+        """
+        Warp the board on the CUDA device, reusing the device buffers.
+
+        Args:
+            frame: Input frame
+            M_inv: Inverse perspective transform (board to frame)
+            max_size: Side length of the extracted board
+            dst: Optional output image, reused if it has the extracted board's shape
+            flags: Interpolation flags for the warp
+
+        Returns:
+            np.ndarray: Extracted board image
+        """
+        if self._gpu_frame is None:
+            self._gpu_frame = cv2.cuda_GpuMat()
+            self._gpu_board = cv2.cuda_GpuMat()
+
+        # upload and warpPerspective only reallocate when the size changes
+        self._gpu_frame.upload(frame)
+        cv2.cuda.warpPerspective(
+            self._gpu_frame, M_inv, (max_size, max_size), dst=self._gpu_board, flags=flags
+        )
+
+        shape = (max_size, max_size) + frame.shape[2:]
+        if dst is not None and dst.shape == shape and dst.dtype == frame.dtype:
+            self._gpu_board.download(dst)
+            return dst
+        return self._gpu_board.download()
+
+    def _board_transform(self, contour: np.ndarray) -> Tuple[np.ndarray, int]:
+        """
+        Compute the mapping from the extracted board image to the frame.
+
+        Args:
+            contour: Contour of the detected board
+
+        Returns:
+            Tuple[np.ndarray, int]: Inverse perspective transform matrix and the
+            side length of the extracted board image
+        """
         # Order points in the contour (top-left, top-right, bottom-right, bottom-left)
         rect = self.order_points(contour.reshape(4, 2))
         
-        # Get width and height of the board
-        width_a = np.sqrt(((rect[1][0] - rect[0][0]) ** 2) + ((rect[1][1] - rect[0][1]) ** 2))
-        width_b = np.sqrt(((rect[2][0] - rect[3][0]) ** 2) + ((rect[2][1] - rect[3][1]) ** 2))
-        max_width = max(int(width_a), int(width_b))
-        
-        height_a = np.sqrt(((rect[3][0] - rect[0][0]) ** 2) + ((rect[3][1] - rect[0][1]) ** 2))
-        height_b = np.sqrt(((rect[2][0] - rect[1][0]) ** 2) + ((rect[2][1] - rect[1][1]) ** 2))
-        max_height = max(int(height_a), int(height_b))
+        # Get the lengths of the top, bottom, left and right edges of the board
+        edges = rect[[1, 2, 3, 2]] - rect[[0, 3, 0, 1]]
+        lengths = np.linalg.norm(edges, axis=1).astype(np.int32)
+        max_width = lengths[:2].max()
+        max_height = lengths[2:].max()
         
         # Ensure the board is square
-        max_size = max(max_width, max_height)
+        max_size = int(max(max_width, max_height))
         
         # Define destination points for perspective transform
-        dst = np.array([
-            [0, 0],
-            [max_size - 1, 0],
-            [max_size - 1, max_size - 1],
-            [0, max_size - 1]
-        ], dtype="float32")
-        
-        # Calculate perspective transform matrix
-        M = cv2.getPerspectiveTransform(rect, dst)
+        dst_pts = self._UNIT_SQUARE * np.float32(max_size - 1)
         
-        # Apply perspective transform
-        warped = cv2.warpPerspective(frame, M, (max_size, max_size))
+        # Calculate the perspective transform matrix and invert it the same way
+        # warpPerspective would
+        M = cv2.getPerspectiveTransform(rect, dst_pts)
+        _, M_inv = cv2.invert(M)
         
-        return warped
+        return M_inv, max_size
 
     @staticmethod
     def order_points(pts: np.ndarray) -> np.ndarray:
@@ -132,30 +424,33 @@ class BoardDetector:
         Returns:
             np.ndarray: Ordered points
         """
-        # Initialize ordered points
-        rect = np.zeros((4, 2), dtype="float32")
+        # With only four points, plain Python avoids NumPy dispatch overhead
+        points = pts.tolist()
         
         # Top-left point has the smallest sum
         # Bottom-right point has the largest sum
-        s = pts.sum(axis=1)
-        rect[0] = pts[np.argmin(s)]
-        rect[2] = pts[np.argmax(s)]
+        s = [x + y for x, y in points]
+        top_left = points[s.index(min(s))]
+        bottom_right = points[s.index(max(s))]
         
         # Top-right point has the smallest difference
         # Bottom-left point has the largest difference
-        diff = np.diff(pts, axis=1)
-        rect[1] = pts[np.argmin(diff)]
-        rect[3] = pts[np.argmax(diff)]
+        diff = [y - x for x, y in points]
+        top_right = points[diff.index(min(diff))]
+        bottom_left = points[diff.index(max(diff))]
         
-        return rect
+        return np.array([top_left, top_right, bottom_right, bottom_left], dtype=np.float32)
 
-    def draw_board_contour(self, frame: np.ndarray, contour: np.ndarray) -> np.ndarray:
+    def draw_board_contour(
+        self, frame: np.ndarray, contour: np.ndarray, inplace: bool = False
+    ) -> np.ndarray:
         """
         Draw the detected board contour on the frame.
 
         Args:
             frame: Input frame
             contour: Contour of the detected board
+            inplace: Draw directly on the input frame instead of a copy
 
         Returns:
             np.ndarray: Frame with board contour drawn
@@ -163,7 +458,7 @@ class BoardDetector:
         if contour is None:
             return frame
             
-        result = frame.copy()
+        result = frame if inplace else frame.copy()
         cv2.drawContours(result, [contour], 0, (0, 255, 0), 2)
         
         # Draw the corners
@@ -173,7 +468,7 @@ class BoardDetector:
             
         return result
 
-    def detect_grid(self, board_img: np.ndarray) -> List[List[Tuple[int, int, int, int]]]:
+    def detect_grid(self, board_img: np.ndarray) -> np.ndarray:
         """
         Detect the chess grid (8x8) from the normalized board image.
 
@@ -181,30 +476,31 @@ class BoardDetector:
             board_img: Normalized chess board image
 
         Returns:
-            List[List[Tuple[int, int, int, int]]]: Grid cells as (x, y, w, h)
+            np.ndarray: Read-only (8, 8, 4) int32 array of grid cells as (x, y, w, h),
+            indexed as grid[row][col]
         """
         height, width = board_img.shape[:2]
         cell_size = min(height, width) // 8
-        
-        # Create grid cells
-        grid = []
-        for row in range(8):
-            grid_row = []
-            for col in range(8):
-                x = col * cell_size
-                y = row * cell_size
-                grid_row.append((x, y, cell_size, cell_size))
-            grid.append(grid_row)
-            
+
+        # The grid only depends on the cell size, so build it once per size
+        grid = self._grid_cache.get(cell_size)
+        if grid is None:
+            offsets = np.arange(8, dtype=np.int32) * cell_size
+            x, y = np.meshgrid(offsets, offsets)
+            size = np.full_like(x, cell_size)
+            grid = np.stack((x, y, size, size), axis=-1)
+            grid.flags.writeable = False
+            self._grid_cache[cell_size] = grid
+
         return grid
 
-    def draw_grid(self, board_img: np.ndarray, grid: List[List[Tuple[int, int, int, int]]]) -> np.ndarray:
+    def draw_grid(self, board_img: np.ndarray, grid: np.ndarray) -> np.ndarray:
         """
         Draw the chess grid on the board image.
 
         Args:
             board_img: Normalized chess board image
-            grid: Grid cells as (x, y, w, h)
+            grid: Grid cells as (x, y, w, h), as returned by detect_grid
 
         Returns:
             np.ndarray: Board image with grid drawn
@@ -212,9 +508,7 @@ class BoardDetector:
         result = board_img.copy()
         
         # Draw grid lines
-        for row in range(8):
-            for col in range(8):
-                x, y, w, h = grid[row][col]
-                cv2.rectangle(result, (x, y), (x + w, y + h), (0, 255, 0), 1)
+        for x, y, w, h in np.reshape(grid, (-1, 4)).tolist():
+            cv2.rectangle(result, (x, y), (x + w, y + h), (0, 255, 0), 1)
                 
         return result
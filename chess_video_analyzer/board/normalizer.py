@@ -2,9 +2,39 @@
 Chess board normalization module for chess video analyzer.
 """
 
+from collections import OrderedDict
+
 import cv2
 import numpy as np
-from typing import List, Optional, Tuple
+from typing import Optional, Tuple
+
+from chess_video_analyzer.utils.jit import NUMBA_AVAILABLE, njit
+
+# Number of recently used rotation matrices kept by BoardNormalizer.rotate_board.
+# The board orientation drifts slowly, so only a few are reused.
+ROTATION_CACHE_SIZE = 8
+
+
+@njit(cache=True)
+def _dominant_angle(segments: np.ndarray) -> float:
+    """
+    Find the most common line normal angle of a set of line segments.
+
+    Args:
+        segments: Line segments as an (N, 4) array of x1, y1, x2, y2
+
+    Returns:
+        float: Dominant angle in degrees (-90 to 90)
+    """
+    hist = np.zeros(181, dtype=np.int32)
+    for i in range(segments.shape[0]):
+        dx = float(segments[i, 2] - segments[i, 0])
+        dy = float(segments[i, 3] - segments[i, 1])
+        angle = (np.degrees(np.arctan2(dy, dx)) - 90.0) % 180.0
+        if angle > 90.0:
+            angle -= 180.0
+        hist[int(np.rint(angle + 90.0))] += 1
+    return float(np.argmax(hist) - 90)
 
 
 class BoardNormalizer:
@@ -12,6 +42,10 @@ class BoardNormalizer:
     Normalizes chess board images for position extraction.
     """
 
+    # Cell colors indexed as [row, col]: True for white cells, False for black
+    CELL_COLORS = (np.add.outer(np.arange(8), np.arange(8)) & 1) == 0
+    CELL_COLORS.setflags(write=False)
+
     def __init__(self, target_size: int = 800):
         """
         Initialize the board normalizer.
@@ -21,12 +55,24 @@ class BoardNormalizer:
         """
         self.target_size = target_size
 
-    def normalize_board(self, board_img: np.ndarray) -> np.ndarray:
+        # Reusable buffers for enhance_normalized
+        self._gray_buf = None
+        self._thresh_buf = None
+
+        # Recently used rotation matrices keyed by (angle, shape), least recently
+        # used first, and reusable rotate_board output
+        self._rot_cache = OrderedDict()
+        self._warp_buf = None
+
+    def normalize_board(
+        self, board_img: np.ndarray, dst: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """
         Normalize the board image for consistent processing.
 
         Args:
             board_img: Input board image
+            dst: Optional output image, reused if it has the normalized shape
 
         Returns:
             np.ndarray: Normalized board image
@@ -35,37 +81,100 @@ class BoardNormalizer:
             raise ValueError("Board image cannot be None")
             
         # Resize to target size
-        normalized = cv2.resize(board_img, (self.target_size, self.target_size))
+        normalized = cv2.resize(board_img, (self.target_size, self.target_size), dst=dst)
         
         return normalized
 
-    def enhance_board(self, board_img: np.ndarray) -> np.ndarray:
+    def enhance_board(
+        self, board_img: np.ndarray, gray: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """
         Enhance the board image for better position extraction.
 
         Args:
             board_img: Input board image
+            gray: Grayscale version of the board image, if already computed
 
         Returns:
             np.ndarray: Enhanced board image
         """
+        # Convert to grayscale if needed
+        if gray is None:
+            if len(board_img.shape) == 3:
+                gray = cv2.cvtColor(board_img, cv2.COLOR_BGR2GRAY)
+            else:
+                gray = board_img
+            
+        return self._equalize_threshold(gray)
+
+    def enhance_normalized(self, board_img: np.ndarray) -> np.ndarray:
+        """
+        Normalize and enhance the board image in a single pass.
+
+        Applies the same enhancement as enhance_board, but to a board that is
+        converted to grayscale before it is resized, with area interpolation,
+        so only one channel is resized. The result therefore differs slightly
+        from enhance_board(normalize_board(board_img)), which resizes the color
+        image bilinearly.
+
+        Intermediate images are kept in internal buffers reused across calls.
+        The returned image is one of them and is overwritten by the next call;
+        passing it back in as board_img is allowed.
+
+        Args:
+            board_img: Input board image
+
+        Returns:
+            np.ndarray: Normalized, enhanced grayscale board image
+        """
+        if board_img is None:
+            raise ValueError("Board image cannot be None")
+
+        size = (self.target_size, self.target_size)
+        if self._gray_buf is None or self._gray_buf.shape != size:
+            self._gray_buf = np.empty(size, dtype=np.uint8)
+            self._thresh_buf = np.empty(size, dtype=np.uint8)
+
         # Convert to grayscale if needed
         if len(board_img.shape) == 3:
             gray = cv2.cvtColor(board_img, cv2.COLOR_BGR2GRAY)
         else:
-            gray = board_img.copy()
-            
+            gray = board_img
+
+        # Resize the single-channel image to target size
+        cv2.resize(gray, size, dst=self._gray_buf, interpolation=cv2.INTER_AREA)
+
+        # Equalize in place and threshold into the output buffer
+        return self._equalize_threshold(
+            self._gray_buf, equalized=self._gray_buf, dst=self._thresh_buf
+        )
+
+    @staticmethod
+    def _equalize_threshold(
+        gray: np.ndarray,
+        equalized: Optional[np.ndarray] = None,
+        dst: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Equalize the histogram of a grayscale board and threshold it adaptively.
+
+        Args:
+            gray: Grayscale board image
+            equalized: Optional image for the equalized board (may be gray)
+            dst: Optional image for the result
+
+        Returns:
+            np.ndarray: Enhanced board image
+        """
         # Apply histogram equalization
-        equalized = cv2.equalizeHist(gray)
-        
+        equalized = cv2.equalizeHist(gray, dst=equalized)
+
         # Apply adaptive thresholding
-        thresh = cv2.adaptiveThreshold(
-            equalized, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
+        return cv2.adaptiveThreshold(
+            equalized, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2, dst=dst
         )
-        
-        return thresh
 
-    def create_grid(self, board_img: np.ndarray) -> List[List[np.ndarray]]:
+    def create_grid(self, board_img: np.ndarray) -> np.ndarray:
         """
         Create a grid of cell images from the board.
 
@@ -73,21 +182,19 @@ class BoardNormalizer:
             board_img: Normalized board image
 
         Returns:
-            List[List[np.ndarray]]: Grid of cell images
+            np.ndarray: Cell images as an (8, 8, cell_size, cell_size[, channels])
+            array, indexed as grid[row][col]
         """
         height, width = board_img.shape[:2]
         cell_size = height // 8  # Assuming square board
-        
-        grid = []
-        for row in range(8):
-            grid_row = []
-            for col in range(8):
-                # Extract cell image
-                y = row * cell_size
-                x = col * cell_size
-                cell = board_img[y:y+cell_size, x:x+cell_size]
-                grid_row.append(cell)
-            grid.append(grid_row)
+        board_size = cell_size * 8
+
+        # Split rows and columns into (8, cell_size) blocks and bring the block
+        # indices to the front
+        cells = board_img[:board_size, :board_size]
+        grid = cells.reshape(
+            8, cell_size, 8, cell_size, *board_img.shape[2:]
+        ).swapaxes(1, 2)
             
         return grid
 
@@ -102,7 +209,16 @@ class BoardNormalizer:
         Returns:
             str: 'white' or 'black'
         """
-        return 'white' if (row + col) % 2 == 0 else 'black'
+        return 'white' if self.CELL_COLORS[row, col] else 'black'
+
+    def colors_mask(self) -> np.ndarray:
+        """
+        Get the colors of all cells.
+
+        Returns:
+            np.ndarray: Read-only (8, 8) boolean array, True for white cells
+        """
+        return self.CELL_COLORS
 
     def adjust_brightness_contrast(
         self, img: np.ndarray, brightness: float = 0, contrast: float = 1
@@ -118,56 +234,65 @@ class BoardNormalizer:
         Returns:
             np.ndarray: Adjusted image
         """
-        # Convert brightness from -1:1 to 0:100
+        # Convert brightness from -1:1 to -100:100
         beta = int(brightness * 100)
         
-        # Convert contrast from 0:3 to 0:300
-        alpha = contrast * 100
-        
-        # Apply brightness and contrast adjustment
-        adjusted = cv2.convertScaleAbs(img, alpha=alpha/100, beta=beta)
+        # Apply brightness and contrast adjustment (convertScaleAbs is vectorized
+        # and measured faster than a cv2.LUT lookup table for 8-bit images)
+        adjusted = cv2.convertScaleAbs(img, alpha=contrast, beta=beta)
         
         return adjusted
 
-    def detect_board_orientation(self, board_img: np.ndarray) -> float:
+    def detect_board_orientation(
+        self, board_img: np.ndarray, gray: Optional[np.ndarray] = None
+    ) -> float:
         """
         Detect the orientation of the board.
 
         Args:
             board_img: Input board image
+            gray: Grayscale version of the board image, if already computed
 
         Returns:
             float: Rotation angle in degrees
         """
         # Convert to grayscale if needed
-        if len(board_img.shape) == 3:
-            gray = cv2.cvtColor(board_img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = board_img.copy()
+        if gray is None:
+            if len(board_img.shape) == 3:
+                gray = cv2.cvtColor(board_img, cv2.COLOR_BGR2GRAY)
+            else:
+                gray = board_img
             
-        # Apply Canny edge detection
-        edges = cv2.Canny(gray, 50, 150, apertureSize=3)
+        # Apply Canny edge detection. Thin edges keep the Hough transform below
+        # cheap, and the L2 gradient keeps diagonal grid lines at full strength
+        edges = cv2.Canny(gray, 50, 150, apertureSize=3, L2gradient=True)
         
-        # Detect lines using Hough transform
-        lines = cv2.HoughLines(edges, 1, np.pi/180, threshold=100)
+        # Detect line segments using probabilistic Hough transform
+        width = gray.shape[1]
+        lines = cv2.HoughLinesP(
+            edges, 1, np.pi/180, threshold=80, minLineLength=width // 4, maxLineGap=10
+        )
         
         if lines is None:
             return 0.0
             
-        # Calculate the dominant angle
-        angles = []
-        for line in lines:
-            rho, theta = line[0]
-            # Convert theta to degrees and normalize to -90 to 90
-            angle = np.degrees(theta) % 180
-            if angle > 90:
-                angle -= 180
-            angles.append(angle)
+        # Use the single-pass compiled kernel when Numba is installed
+        segments = lines.reshape(-1, 4)
+        if NUMBA_AVAILABLE:
+            return _dominant_angle(np.ascontiguousarray(segments))
             
-        # Find the most common angle
-        angles = np.array(angles)
-        hist, bins = np.histogram(angles, bins=180)
-        dominant_angle = bins[np.argmax(hist)]
+        # Convert segment directions to line normal angles in degrees (as returned
+        # by cv2.HoughLines) and normalize to -90 to 90
+        segments = segments.astype(np.float64)
+        dx = segments[:, 2] - segments[:, 0]
+        dy = segments[:, 3] - segments[:, 1]
+        angles = (np.degrees(np.arctan2(dy, dx)) - 90) % 180
+        angles[angles > 90] -= 180
+            
+        # Find the most common angle using 1-degree bins
+        bins = np.rint(angles + 90).astype(np.int32)
+        hist = np.bincount(bins, minlength=181)
+        dominant_angle = float(np.argmax(hist) - 90)
         
         return dominant_angle
 
@@ -175,6 +300,9 @@ class BoardNormalizer:
         """
         Rotate the board image by the given angle.
 
+        The angle is rounded to 0.1 degrees. The returned image is an internal
+        buffer that is overwritten by the next call.
+
         Args:
             board_img: Input board image
             angle: Rotation angle in degrees
@@ -183,12 +311,29 @@ class BoardNormalizer:
             np.ndarray: Rotated board image
         """
         height, width = board_img.shape[:2]
-        center = (width // 2, height // 2)
         
         # Get rotation matrix
-        M = cv2.getRotationMatrix2D(center, angle, 1.0)
+        key = (round(angle, 1), board_img.shape)
+        M = self._rot_cache.get(key)
+        if M is None:
+            center = (width // 2, height // 2)
+            M = cv2.getRotationMatrix2D(center, key[0], 1.0)
+            self._rot_cache[key] = M
+            if len(self._rot_cache) > ROTATION_CACHE_SIZE:
+                self._rot_cache.popitem(last=False)
+        else:
+            self._rot_cache.move_to_end(key)
+
+        if (
+            self._warp_buf is None
+            or self._warp_buf.shape != board_img.shape
+            or self._warp_buf.dtype != board_img.dtype
+        ):
+            self._warp_buf = np.empty_like(board_img)
         
         # Apply rotation
-        rotated = cv2.warpAffine(board_img, M, (width, height), flags=cv2.INTER_LINEAR)
+        rotated = cv2.warpAffine(
+            board_img, M, (width, height), dst=self._warp_buf, flags=cv2.INTER_LINEAR
+        )
         
         return rotated
@@ -5,12 +5,17 @@ Command-line interface for chess video analyzer.
 import argparse
 import cv2
 import os
+import queue
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import chess
+import numpy as np
 
 from chess_video_analyzer.video.input import VideoInput
 from chess_video_analyzer.video.frame import FrameExtractor
@@ -22,6 +27,12 @@ from chess_video_analyzer.moves.tracker import MoveTracker
 from chess_video_analyzer.notation.generator import NotationGenerator
 from chess_video_analyzer.utils.visualization import Visualizer
 
+# Maximum number of decoded frames waiting to be analyzed
+FRAME_QUEUE_SIZE = 8
+
+# JPEG quality for saved frames
+JPEG_QUALITY = 85
+
 
 def parse_args():
     """Parse command-line arguments."""
@@ -87,9 +98,131 @@ def parse_args():
         help="End time in seconds"
     )
     
+    parser.add_argument(
+        "--hw-decode",
+        action="store_true",
+        help="Decode video on the GPU when available"
+    )
+    
+    parser.add_argument(
+        "--no-opencl",
+        action="store_true",
+        help="Disable OpenCL acceleration for board detection"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=2,
+        help="Number of threads analyzing frames in parallel"
+    )
+    
     return parser.parse_args()
 
 
+class FrameAnalyzer:
+    """
+    Extracts and validates the position in a frame whose board was detected.
+
+    Board detection tracks the board from one sampled frame to the next, so it
+    runs in frame order on the decoder thread; the steps here only depend on
+    the frame and the board contour. Analyzers are not shared between threads,
+    as the detector's warp cache and the validator's result cache are not
+    thread-safe.
+    """
+
+    def __init__(self):
+        """
+        Initialize the frame analyzer.
+        """
+        self.board_detector = BoardDetector()
+        self.board_normalizer = BoardNormalizer()
+        self.position_extractor = PositionExtractor()
+        self.position_validator = PositionValidator()
+
+    def analyze(
+        self, processed_frame: np.ndarray, board_contour: np.ndarray
+    ) -> Tuple[Optional[chess.Board], bool, List[str]]:
+        """
+        Analyze a frame.
+
+        Args:
+            processed_frame: Preprocessed frame
+            board_contour: Contour of the board detected in the frame
+
+        Returns:
+            Tuple[Optional[chess.Board], bool, List[str]]: Extracted board,
+            validation result and validation issues (None if the board could
+            not be extracted)
+        """
+        # Extract and normalize board
+        board_img = self.board_detector.extract_board(processed_frame, board_contour)
+        
+        if board_img is None:
+            return None, False, []
+            
+        # Normalize board
+        normalized_board = self.board_normalizer.normalize_board(board_img)
+        
+        # Create grid
+        grid = self.board_normalizer.create_grid(normalized_board)
+        
+        # Extract position
+        board = self.position_extractor.extract_position(normalized_board, grid)
+        
+        # Validate position
+        is_valid, issues = self.position_validator.validate_position(board)
+        
+        return board, is_valid, issues
+
+
+def _decode_frames(
+    video_input: VideoInput,
+    frame_extractor: FrameExtractor,
+    board_detector: BoardDetector,
+    frame_interval: int,
+    frame_count: int,
+    end_frame: Optional[int],
+    frame_queue: queue.Queue,
+    stop_event: threading.Event,
+) -> None:
+    """
+    Read frames, detect the board in every sampled frame and queue the frame
+    index, processed frame and board contour.
+
+    Runs on the decoder thread, so that the board detector sees the sampled
+    frames one after another in frame order. A None sentinel is queued when
+    decoding ends, preceded by the exception if decoding failed, so that it can
+    be raised on the main thread.
+    """
+    try:
+        while not stop_event.is_set():
+            if end_frame is not None and frame_count >= end_frame:
+                break
+                
+            # Frames between samples are skipped without converting them
+            if frame_count % frame_interval:
+                if not video_input.grab():
+                    break
+            else:
+                ret, frame = video_input.get_frame()
+                if not ret:
+                    break
+                    
+                # Process frame and detect board
+                processed_frame = frame_extractor.process_frame(frame)
+                gray_frame = cv2.cvtColor(processed_frame, cv2.COLOR_BGR2GRAY)
+                board_contour = board_detector.detect_board(processed_frame, gray=gray_frame)
+                
+                frame_queue.put((frame_count, processed_frame, board_contour))
+                
+            frame_count += 1
+    except Exception as e:
+        frame_queue.put(e)
+    finally:
+        frame_queue.put(None)
+
+
 def process_video(args):
     """Process the video file."""
     # Create output directory if it doesn't exist
@@ -97,12 +230,9 @@ def process_video(args):
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Initialize components
-    video_input = VideoInput(args.video_path)
+    video_input = VideoInput(args.video_path, hw_decode=args.hw_decode)
     frame_extractor = FrameExtractor(target_fps=args.fps)
-    board_detector = BoardDetector()
-    board_normalizer = BoardNormalizer()
-    position_extractor = PositionExtractor()
-    position_validator = PositionValidator()
+    board_detector = BoardDetector(use_opencl=not args.no_opencl)
     move_tracker = MoveTracker()
     notation_generator = NotationGenerator()
     visualizer = Visualizer()
@@ -119,11 +249,13 @@ def process_video(args):
     start_frame = int(args.start * video_input.fps)
     end_frame = int(args.end * video_input.fps) if args.end is not None else None
     
-    # Skip to start frame
+    # Seek to start frame, skipping frame by frame if the backend cannot seek
     frame_count = 0
+    if start_frame > 0 and video_input.seek(start_frame):
+        frame_count = start_frame
+        
     while frame_count < start_frame:
-        ret, _ = video_input.get_frame()
-        if not ret:
+        if not video_input.grab():
             print(f"Error: Could not skip to start frame {start_frame}")
             return False
         frame_count += 1
@@ -136,111 +268,168 @@ def process_video(args):
     print(f"Video properties: {video_input.width}x{video_input.height}, {video_input.fps} FPS")
     print(f"Target processing FPS: {args.fps}")
     
-    while True:
-        # Get frame
-        ret, frame = video_input.get_frame()
-        if not ret or (end_frame is not None and frame_count >= end_frame):
-            break
+    # Decode and detect boards on a background thread while worker threads
+    # extract positions
+    workers = max(1, args.workers)
+    frame_queue = queue.Queue(maxsize=FRAME_QUEUE_SIZE)
+    stop_event = threading.Event()
+    decoder = threading.Thread(
+        target=_decode_frames,
+        args=(
+            video_input,
+            frame_extractor,
+            board_detector,
+            frame_extractor.frame_interval,
+            frame_count,
+            end_frame,
+            frame_queue,
+            stop_event,
+        ),
+        daemon=True,
+    )
+    decoder.start()
+    
+    thread_state = threading.local()
+    
+    def analyze_frame(processed_frame: np.ndarray, board_contour: np.ndarray):
+        """Analyze a frame with the calling worker thread's analyzer."""
+        analyzer = getattr(thread_state, "analyzer", None)
+        if analyzer is None:
+            analyzer = thread_state.analyzer = FrameAnalyzer()
+        return analyzer.analyze(processed_frame, board_contour)
+    
+    executor = ThreadPoolExecutor(max_workers=workers)
+    
+    # Encode saved frames in the background
+    writer = ThreadPoolExecutor(max_workers=2) if args.save_frames else None
+    
+    pending = deque()
+    decoding = True
+    decode_error = None
+    
+    try:
+        while True:
+            # Keep the workers busy; results are consumed in frame order
+            while decoding and len(pending) < workers * 2:
+                item = frame_queue.get()
+                if item is None:
+                    decoding = False
+                    break
+                if isinstance(item, Exception):
+                    # Raised once the frames decoded before it are handled
+                    decode_error = item
+                    continue
+                index, processed_frame, board_contour = item
+                future = None
+                if board_contour is not None:
+                    future = executor.submit(analyze_frame, processed_frame, board_contour)
+                pending.append((index, processed_frame, board_contour, future))
+                
+            if not pending:
+                if decode_error is not None:
+                    raise decode_error
+                break
+                
+            frame_count, processed_frame, board_contour, future = pending.popleft()
             
-        # Process every nth frame based on frame interval
-        if frame_count % frame_extractor.frame_interval == 0:
             print(f"Processing frame {frame_count} ({frame_count / video_input.fps:.2f} seconds)")
+            processed_frames += 1
             
-            # Process frame
-            processed_frame = frame_extractor.process_frame(frame)
-            
-            # Detect board
-            board_contour = board_detector.detect_board(processed_frame)
-            
-            if board_contour is not None:
-                # Extract and normalize board
-                board_img = board_detector.extract_board(processed_frame, board_contour)
+            if future is None:
+                continue
+                
+            board, is_valid, issues = future.result()
+            if board is None:
+                continue
                 
-                if board_img is not None:
-                    # Normalize board
-                    normalized_board = board_normalizer.normalize_board(board_img)
+            if is_valid:
+                # Track move
+                if not detected_positions:
+                    move_tracker.set_initial_position(board)
+                else:
+                    move = move_tracker.track_move(board)
                     
-                    # Create grid
-                    grid = board_normalizer.create_grid(normalized_board)
+                    if move:
+                        notation_generator.add_move(move)
+                        print(f"Detected move: {board.san(move)}")
+                        
+                detected_positions.append(board)
+                
+                # Save frame if requested
+                if args.save_frames:
+                    frame_path = output_dir / f"frame_{frame_count:06d}.jpg"
                     
-                    # Extract position
-                    board = position_extractor.extract_position(normalized_board, grid)
+                    # Create visualization
+                    board_vis = visualizer.draw_board(board)
+                    board_vis = visualizer.draw_coordinates(board_vis, inplace=True)
                     
-                    # Validate position
-                    is_valid, issues = position_validator.validate_position(board)
+                    # Add FEN overlay
+                    fen = board.fen().split(" ")[0]  # Just the piece placement part
+                    board_vis = visualizer.add_text_overlay(board_vis, fen, inplace=True)
                     
-                    if is_valid:
-                        # Track move
-                        if not detected_positions:
-                            move_tracker.set_initial_position(board)
-                        else:
-                            move = move_tracker.track_move(board)
-                            
-                            if move:
-                                notation_generator.add_move(move)
-                                print(f"Detected move: {board.san(move)}")
-                                
-                        detected_positions.append(board)
-                        
-                        # Save frame if requested
-                        if args.save_frames:
-                            frame_path = output_dir / f"frame_{frame_count:06d}.jpg"
-                            
-                            # Create visualization
-                            board_vis = visualizer.draw_board(board)
-                            board_vis = visualizer.draw_coordinates(board_vis)
-                            
-                            # Add FEN overlay
-                            fen = board.fen().split(" ")[0]  # Just the piece placement part
-                            board_vis = visualizer.add_text_overlay(board_vis, fen)
-                            
-                            # Create side-by-side visualization
-                            vis_img = visualizer.create_side_by_side(
-                                processed_frame,
-                                board_vis,
-                                labels=("Video Frame", "Detected Position")
-                            )
-                            
-                            cv2.imwrite(str(frame_path), vis_img)
-                            
-                        # Show visualization if requested
-                        if args.visualize:
-                            # Draw board contour
-                            contour_img = board_detector.draw_board_contour(processed_frame, board_contour)
-                            
-                            # Draw board visualization
-                            board_vis = visualizer.draw_board(board)
-                            board_vis = visualizer.draw_coordinates(board_vis)
-                            
-                            # Create side-by-side visualization
-                            vis_img = visualizer.create_side_by_side(
-                                contour_img,
-                                board_vis,
-                                labels=("Detected Board", "Extracted Position")
-                            )
-                            
-                            # Add FEN overlay
-                            fen = board.fen().split(" ")[0]  # Just the piece placement part
-                            vis_img = visualizer.add_text_overlay(vis_img, fen)
-                            
-                            # Show visualization
-                            cv2.imshow("Chess Video Analyzer", vis_img)
-                            
-                            # Wait for key press (1ms)
-                            key = cv2.waitKey(1)
-                            if key == 27:  # ESC key
-                                break
-                    else:
-                        print(f"Invalid position detected in frame {frame_count}:")
-                        for issue in issues:
-                            print(f"  - {issue}")
-            
-            processed_frames += 1
-            
-        frame_count += 1
+                    # Create side-by-side visualization
+                    vis_img = visualizer.create_side_by_side(
+                        processed_frame,
+                        board_vis,
+                        labels=("Video Frame", "Detected Position")
+                    )
+                    
+                    writer.submit(
+                        cv2.imwrite,
+                        str(frame_path),
+                        vis_img,
+                        [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY],
+                    )
+                    
+                # Show visualization if requested
+                if args.visualize:
+                    # Draw board contour (the frame is not used after this point)
+                    contour_img = board_detector.draw_board_contour(
+                        processed_frame, board_contour, inplace=True
+                    )
+                    
+                    # Draw board visualization
+                    board_vis = visualizer.draw_board(board)
+                    board_vis = visualizer.draw_coordinates(board_vis, inplace=True)
+                    
+                    # Create side-by-side visualization
+                    vis_img = visualizer.create_side_by_side(
+                        contour_img,
+                        board_vis,
+                        labels=("Detected Board", "Extracted Position")
+                    )
+                    
+                    # Add FEN overlay
+                    fen = board.fen().split(" ")[0]  # Just the piece placement part
+                    vis_img = visualizer.add_text_overlay(vis_img, fen, inplace=True)
+                    
+                    # Show visualization
+                    cv2.imshow("Chess Video Analyzer", vis_img)
+                    
+                    # Check for a key press without blocking
+                    key = cv2.pollKey()
+                    if key == 27:  # ESC key
+                        break
+            else:
+                print(f"Invalid position detected in frame {frame_count}:")
+                for issue in issues:
+                    print(f"  - {issue}")
+    finally:
+        # Stop the decoder, unblocking it if the frame queue is full
+        stop_event.set()
+        while decoder.is_alive():
+            try:
+                frame_queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        executor.shutdown(wait=True, cancel_futures=True)
         
-    # Close video
-    video_input.close()
+        # Wait for pending frame writes
+        if writer is not None:
+            writer.shutdown(wait=True)
+        
+        # Close video
+        video_input.close()
     
     # Close visualization window
     if args.visualize:
@@ -255,12 +444,9 @@ def process_video(args):
         # Generate PGN
         if args.pgn:
             pgn_path = output_dir / "game.pgn"
-            pgn = notation_generator.get_pgn()
             
-            with open(pgn_path, "w") as f:
-                f.write(pgn)
-                
-            print(f"PGN output saved to {pgn_path}")
+            if notation_generator.export_pgn(str(pgn_path)):
+                print(f"PGN output saved to {pgn_path}")
             
         # Generate FEN
         if args.fen:
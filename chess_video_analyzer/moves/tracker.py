@@ -3,7 +3,7 @@ Chess move tracking module for chess video analyzer.
 """
 
 import chess
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 
 class MoveTracker:
@@ -17,7 +17,24 @@ class MoveTracker:
         """
         self.previous_board = None
         self.current_board = None
-        self.moves = []
+        self._moves = []
+        self._moves_view = None  # Cached tuple of moves, None when outdated
+        self._owns_current = False  # Whether current_board may be modified
+
+    @property
+    def moves(self) -> Tuple[chess.Move, ...]:
+        """
+        Tracked moves.
+
+        Read-only, as the moves are only changed by tracking new positions.
+        The returned tuple is shared between calls until the moves change.
+
+        Returns:
+            Tuple[chess.Move, ...]: Tracked moves
+        """
+        if self._moves_view is None:
+            self._moves_view = tuple(self._moves)
+        return self._moves_view
 
     def set_initial_position(self, board: chess.Board) -> None:
         """
@@ -28,34 +45,69 @@ class MoveTracker:
         """
         self.previous_board = board.copy()
         self.current_board = board.copy()
-        self.moves = []
+        self._moves = []
+        self._moves_view = None
+        self._owns_current = True
 
     def track_move(self, new_board: chess.Board) -> Optional[chess.Move]:
         """
         Track a move between the current position and a new position.
 
+        The tracker keeps a reference to new_board instead of a copy, so the
+        board must not be modified by the caller afterwards.
+
         Args:
             new_board: New chess board position
 
         Returns:
             Optional[chess.Move]: Detected move or None if no move detected
         """
+        self._owns_current = False
+        
         if self.current_board is None:
-            self.current_board = new_board.copy()
+            self.current_board = new_board
+            return None
+            
+        # Most frames show the same position, which needs no move detection
+        if self._compare_boards(self.current_board, new_board):
+            self.current_board = new_board
             return None
             
         # Update board references
-        self.previous_board = self.current_board.copy()
-        self.current_board = new_board.copy()
+        self.previous_board = self.current_board
+        self.current_board = new_board
         
         # Detect the move
         move = self._detect_move()
         
         if move:
-            self.moves.append(move)
+            self._moves.append(move)
+            self._moves_view = None
             
         return move
 
+    def track_move_incremental(self, move: chess.Move) -> None:
+        """
+        Track a move that is already known.
+
+        This is the fast path for callers that determine the move themselves:
+        the move is applied to the current board instead of being detected by
+        comparing positions. Use track_move for vision-only pipelines.
+
+        Args:
+            move: Move played from the current position
+        """
+        if self.current_board is None:
+            self.current_board = chess.Board()
+        elif not self._owns_current:
+            # The current board came from the caller, apply moves to a copy
+            self.current_board = self.current_board.copy()
+        self._owns_current = True
+        
+        self.current_board.push(move)
+        self._moves.append(move)
+        self._moves_view = None
+
     def _detect_move(self) -> Optional[chess.Move]:
         """
         Detect a move between the previous and current positions.
@@ -64,19 +116,24 @@ class MoveTracker:
             Optional[chess.Move]: Detected move or None if no move detected
         """
         # Find differences between the boards
-        changes = []
+        changed = self._changed_squares(self.previous_board, self.current_board)
+        num_changes = chess.popcount(changed)
         
-        for square in chess.SQUARES:
-            prev_piece = self.previous_board.piece_at(square)
-            curr_piece = self.current_board.piece_at(square)
+        if num_changes == 0:
+            return None  # No changes
             
-            if prev_piece != curr_piece:
-                changes.append((square, prev_piece, curr_piece))
+        # Only simple moves, en passant and castling are recognized from the
+        # changes alone, anything else needs a legal move search
+        if num_changes > 4 or num_changes == 1:
+            return self._find_legal_move(changed)
+            
+        # Visit only the changed squares
+        changes = [
+            (square, self.previous_board.piece_at(square), self.current_board.piece_at(square))
+            for square in chess.scan_forward(changed)
+        ]
                 
         # Analyze changes to determine the move
-        if len(changes) == 0:
-            return None  # No changes
-            
         if len(changes) == 2:
             # Simple move: one piece disappears, another appears
             from_square = None
@@ -154,26 +211,52 @@ class MoveTracker:
                     return chess.Move(pawn_from, pawn_to)
                     
         # If we can't determine the move, try legal moves
-        return self._find_legal_move()
+        return self._find_legal_move(changed)
+
+    @staticmethod
+    def _changed_squares(board1: chess.BaseBoard, board2: chess.BaseBoard) -> chess.Bitboard:
+        """
+        Find the squares whose piece differs between two boards.
+
+        Args:
+            board1: First chess board
+            board2: Second chess board
+
+        Returns:
+            chess.Bitboard: Mask of squares with a different piece or color
+        """
+        return (
+            (board1.occupied_co[chess.WHITE] ^ board2.occupied_co[chess.WHITE])
+            | (board1.occupied_co[chess.BLACK] ^ board2.occupied_co[chess.BLACK])
+            | (board1.pawns ^ board2.pawns)
+            | (board1.knights ^ board2.knights)
+            | (board1.bishops ^ board2.bishops)
+            | (board1.rooks ^ board2.rooks)
+            | (board1.queens ^ board2.queens)
+            | (board1.kings ^ board2.kings)
+        )
 
-    def _find_legal_move(self) -> Optional[chess.Move]:
+    def _find_legal_move(self, changed: chess.Bitboard) -> Optional[chess.Move]:
         """
         Find a legal move that transforms the previous position into the current position.
 
+        Args:
+            changed: Mask of squares that differ between the two positions
+
         Returns:
             Optional[chess.Move]: Legal move or None if no matching move found
         """
-        # Get all legal moves from the previous position
-        legal_moves = list(self.previous_board.legal_moves)
-        
-        # Try each legal move
-        for move in legal_moves:
-            test_board = self.previous_board.copy()
-            test_board.push(move)
-            
-            # Check if the resulting position matches the current position
-            if self._compare_boards(test_board, self.current_board):
-                return move
+        # A matching move must start and end on changed squares, which usually
+        # leaves a single candidate to verify
+        board = self.previous_board
+        for move in board.generate_legal_moves(from_mask=changed, to_mask=changed):
+            board.push(move)
+            try:
+                # Check if the resulting position matches the current position
+                if self._compare_boards(board, self.current_board):
+                    return move
+            finally:
+                board.pop()
                 
         return None
 
@@ -188,24 +271,19 @@ class MoveTracker:
         Returns:
             bool: True if the boards represent the same position, False otherwise
         """
-        # Compare piece placement
-        for square in chess.SQUARES:
-            piece1 = board1.piece_at(square)
-            piece2 = board2.piece_at(square)
-            
-            if piece1 != piece2:
-                return False
-                
-        return True
+        # Compare piece placement through the color and piece-type bitboards
+        return self._changed_squares(board1, board2) == chess.BB_EMPTY
 
-    def get_moves(self) -> List[chess.Move]:
+    def get_moves(self) -> Tuple[chess.Move, ...]:
         """
-        Get the list of tracked moves.
+        Get the tracked moves.
+
+        The returned tuple is shared between calls until a new move is tracked.
 
         Returns:
-            List[chess.Move]: List of moves
+            Tuple[chess.Move, ...]: Tracked moves
         """
-        return self.moves.copy()
+        return self.moves
 
     def get_pgn(self) -> str:
         """
@@ -214,24 +292,21 @@ class MoveTracker:
         Returns:
             str: PGN string
         """
-        if not self.moves:
+        if not self._moves:
             return ""
             
         # Create a new board for PGN generation
         board = chess.Board()
         pgn_moves = []
         
-        for i, move in enumerate(self.moves):
+        for i, move in enumerate(self._moves):
             # Add move number for white's moves
             if i % 2 == 0:
                 move_num = i // 2 + 1
                 pgn_moves.append(f"{move_num}.")
                 
-            # Add the move in SAN notation
-            pgn_moves.append(board.san(move))
-            
-            # Apply the move to the board
-            board.push(move)
+            # Add the move in SAN notation and apply it to the board
+            pgn_moves.append(board.san_and_push(move))
             
         return " ".join(pgn_moves)
 
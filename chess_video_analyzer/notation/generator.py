@@ -5,7 +5,7 @@ Chess notation generation module for chess video analyzer.
 import chess
 import chess.pgn
 import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 
 class NotationGenerator:
@@ -17,7 +17,8 @@ class NotationGenerator:
         """
         Initialize the notation generator.
         """
-        self.moves = []
+        self._moves = []
+        self._moves_view = None  # Tuple returned by the moves property
         self.headers = {
             "Event": "Chess Video Analysis",
             "Site": "Unknown",
@@ -28,6 +29,12 @@ class NotationGenerator:
             "Result": "*"
         }
 
+        # Boards and SAN moves extended incrementally as moves are added
+        self._board = None  # Position after all moves
+        self._san_board = None  # Position after the moves in _san_list
+        self._san_list = []
+        self._result_cache = None  # (number of moves, detected result or None)
+
     def add_move(self, move: chess.Move) -> None:
         """
         Add a move to the game.
@@ -35,16 +42,38 @@ class NotationGenerator:
         Args:
             move: Chess move
         """
-        self.moves.append(move)
+        self._moves.append(move)
+        self._moves_view = None
 
-    def set_moves(self, moves: List[chess.Move]) -> None:
+    def set_moves(self, moves: Sequence[chess.Move]) -> None:
         """
         Set the list of moves.
 
         Args:
-            moves: List of chess moves
+            moves: Chess moves, e.g. a list or the tuple from MoveTracker.get_moves
+        """
+        self._moves = list(moves)
+        self._moves_view = None
+        self._board = None
+        self._san_board = None
+        self._san_list = []
+        self._result_cache = None
+
+    @property
+    def moves(self) -> Tuple[chess.Move, ...]:
+        """
+        Moves of the game.
+
+        Read-only, as the notation caches are extended from the moves added
+        since they were built; use add_move and set_moves to change the moves.
+        The returned tuple is shared between calls until the moves change.
+
+        Returns:
+            Tuple[chess.Move, ...]: Moves of the game
         """
-        self.moves = moves.copy()
+        if self._moves_view is None:
+            self._moves_view = tuple(self._moves)
+        return self._moves_view
 
     def set_header(self, key: str, value: str) -> None:
         """
@@ -76,41 +105,61 @@ class NotationGenerator:
         Returns:
             str: PGN string
         """
-        if not self.moves:
-            return ""
+        return "".join(self._iter_pgn(include_headers))
+
+    def _iter_pgn(self, include_headers: bool = True) -> Iterator[str]:
+        """
+        Generate the PGN representation of the game piece by piece.
+
+        Args:
+            include_headers: Whether to include PGN headers
+
+        Returns:
+            Iterator[str]: Header lines followed by the move text, one move
+            number at a time
+        """
+        if not self._moves:
+            return
             
-        # Create a new game
-        game = chess.pgn.Game()
-        
-        # Set headers
-        if include_headers:
-            for key, value in self.headers.items():
-                game.headers[key] = value
+        # Detect the result only once for each number of moves, as the checks
+        # generate legal moves and scan the move history
+        if self._result_cache is None or self._result_cache[0] != len(self._moves):
+            board = self._final_board()
+            result = None
+            
+            if board.is_checkmate():
+                if board.turn == chess.WHITE:
+                    result = "0-1"
+                else:
+                    result = "1-0"
+            elif board.is_stalemate() or board.is_insufficient_material() or board.is_fifty_moves() or board.is_repetition():
+                result = "1/2-1/2"
                 
-        # Add moves
-        node = game
-        board = chess.Board()
-        
-        for move in self.moves:
-            node = node.add_variation(move)
-            board.push(move)
+            self._result_cache = (len(self._moves), result)
             
         # Set result
-        if board.is_checkmate():
-            if board.turn == chess.WHITE:
-                self.headers["Result"] = "0-1"
-            else:
-                self.headers["Result"] = "1-0"
-        elif board.is_stalemate() or board.is_insufficient_material() or board.is_fifty_moves() or board.is_repetition():
-            self.headers["Result"] = "1/2-1/2"
+        if self._result_cache[1] is not None:
+            self.headers["Result"] = self._result_cache[1]
             
+        # Set headers, keeping the seven tag roster first (defaults if excluded)
+        headers = chess.pgn.Headers()
         if include_headers:
-            game.headers["Result"] = self.headers["Result"]
+            headers.update(self.headers)
             
-        # Generate PGN string
-        pgn_string = str(game)
+        # Write the PGN text directly, as a game without variations or comments
+        # does not need a chess.pgn.Game tree
+        for key, value in headers.items():
+            yield f'[{key} "{value}"]\n'
+        yield "\n"
         
-        return pgn_string
+        for i, (white_move, black_move) in enumerate(self.get_move_pairs()):
+            separator = " " if i else ""
+            if black_move:
+                yield f"{separator}{i + 1}. {white_move} {black_move}"
+            else:
+                yield f"{separator}{i + 1}. {white_move}"
+                
+        yield f" {headers['Result']}"
 
     def get_fen(self, move_index: Optional[int] = None) -> str:
         """
@@ -122,18 +171,13 @@ class NotationGenerator:
         Returns:
             str: FEN string
         """
-        board = chess.Board()
-        
-        if not self.moves:
-            return board.fen()
-            
-        if move_index is None:
-            move_index = len(self.moves)
+        if move_index is None or move_index >= len(self._moves):
+            return self._final_board().fen()
             
-        move_index = min(move_index, len(self.moves))
+        board = chess.Board()
         
         for i in range(move_index):
-            board.push(self.moves[i])
+            board.push(self._moves[i])
             
         return board.fen()
 
@@ -144,18 +188,62 @@ class NotationGenerator:
         Returns:
             List[str]: List of moves in SAN notation
         """
-        if not self.moves:
+        if not self._moves:
             return []
             
-        board = chess.Board()
-        move_list = []
-        
-        for move in self.moves:
-            san = board.san(move)
-            move_list.append(san)
+        return self._update_san_list().copy()
+
+    def iter_san(self, start: int = 0) -> Iterator[str]:
+        """
+        Iterate over the moves in SAN notation, starting at a given move.
+
+        Moves are only converted once, so printing the moves added since the
+        last call as the game is tracked does not convert the earlier ones again.
+
+        Args:
+            start: Index of the first move
+
+        Returns:
+            Iterator[str]: Moves in SAN notation
+        """
+        san_list = self._update_san_list()
+        return (san_list[i] for i in range(start, len(san_list)))
+
+    def _update_san_list(self) -> List[str]:
+        """
+        Convert the moves added since the last call to SAN.
+
+        Returns:
+            List[str]: SAN moves shared with later calls, must not be modified
+        """
+        if self._san_board is None:
+            self._san_board = chess.Board()
+            self._san_list = []
+            
+        # Only convert the moves added since the last call, pushing each move
+        # with the same look-ahead that determines its check suffix
+        board = self._san_board
+        for move in self._moves[len(self._san_list):]:
+            self._san_list.append(board.san_and_push(move))
+            
+        return self._san_list
+
+    def _final_board(self) -> chess.Board:
+        """
+        Get the position after all moves, pushing only the moves added since
+        the last call.
+
+        Returns:
+            chess.Board: Board shared with later calls, must not be modified
+        """
+        if self._board is None:
+            self._board = chess.Board()
+            
+        board = self._board
+        for move in self._moves[len(board.move_stack):]:
             board.push(move)
             
-        return move_list
+        return board
 
     def get_move_pairs(self) -> List[Tuple[str, Optional[str]]]:
         """
@@ -204,8 +292,9 @@ class NotationGenerator:
             bool: True if successful, False otherwise
         """
         try:
+            # Write the PGN as it is generated instead of building one string
             with open(file_path, "w") as f:
-                f.write(self.get_pgn())
+                f.writelines(self._iter_pgn())
             return True
         except Exception as e:
             print(f"Error exporting PGN: {e}")
@@ -5,7 +5,50 @@ Chess position extraction module for chess video analyzer.
 import cv2
 import numpy as np
 import chess
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Optional, Tuple
+
+from chess_video_analyzer.utils.jit import NUMBA_AVAILABLE, njit
+
+# Piece symbols indexed by the codes returned by _classify_cells
+_CELL_SYMBOLS = np.array(['', 'P', 'p'])
+
+# Chess squares indexed as [row, col] of the board image (a8 is 0,0)
+_SQUARE_FROM_GRID = np.array(
+    [[chess.square(col, 7 - row) for col in range(8)] for row in range(8)], dtype=np.int8
+)
+_SQUARE_FROM_GRID.setflags(write=False)
+
+
+@njit(cache=True)
+def _classify_cells(gray: np.ndarray) -> np.ndarray:
+    """
+    Classify grayscale cells as empty, white piece or black piece.
+
+    Uses the same rules as PositionExtractor.detect_piece, evaluated exactly
+    on integer pixel sums gathered in a single pass over each cell.
+
+    Args:
+        gray: Grayscale cells as an (8, 8, cell_size, cell_size) array
+
+    Returns:
+        np.ndarray: (8, 8) int8 array of codes (0 empty, 1 white, 2 black)
+    """
+    rows, cols, height, width = gray.shape
+    n = height * width
+    codes = np.zeros((rows, cols), dtype=np.int8)
+    for row in range(rows):
+        for col in range(cols):
+            total = 0
+            total_sq = 0
+            for y in range(height):
+                for x in range(width):
+                    value = np.int64(gray[row, col, y, x])
+                    total += value
+                    total_sq += value * value
+            # std > 40 and mean > 128, multiplied out to stay in integers
+            if n * total_sq - total * total > 1600 * n * n:
+                codes[row, col] = 1 if total > 128 * n else 2
+    return codes
 
 
 class PositionExtractor:
@@ -25,14 +68,18 @@ class PositionExtractor:
         
         # Initialize the board
         self.board = chess.Board()
+        
+        # Text origins of the piece symbols of each cell, keyed by cell size
+        self._text_origins = {}
 
-    def extract_position(self, board_img: np.ndarray, grid: List[List[np.ndarray]]) -> chess.Board:
+    def extract_position(self, board_img: np.ndarray, grid: np.ndarray) -> chess.Board:
         """
         Extract the chess position from a board image.
 
         Args:
-            board_img: Normalized board image
-            grid: Grid of cell images
+            board_img: Normalized board image, color or grayscale
+            grid: Grid of cell images, indexed as grid[row][col]. A grayscale
+                grid skips the color conversion.
 
         Returns:
             chess.Board: Chess board with the detected position
@@ -41,19 +88,61 @@ class PositionExtractor:
         board = chess.Board()
         board.clear()  # Clear all pieces
         
-        # Process each cell in the grid
-        for row in range(8):
-            for col in range(8):
-                cell_img = grid[row][col]
-                piece = self.detect_piece(cell_img)
-                
-                if piece:
-                    # Convert row, col to chess square (a8 is 0,0)
-                    square = chess.square(col, 7 - row)
-                    board.set_piece_at(square, chess.Piece.from_symbol(piece))
+        # Detect the pieces of all cells at once
+        pieces = self.detect_pieces(grid)
+        
+        # Bind lookups used in the loop to locals
+        set_piece_at = board.set_piece_at
+        piece_from_symbol = chess.Piece.from_symbol
+        
+        # Place the pieces of the occupied cells
+        occupied = np.flatnonzero(pieces)
+        squares = _SQUARE_FROM_GRID.ravel()[occupied].tolist()
+        symbols = pieces.ravel()[occupied].tolist()
+        for square, symbol in zip(squares, symbols):
+            set_piece_at(square, piece_from_symbol(symbol))
                     
         return board
 
+    def detect_pieces(self, grid: np.ndarray) -> np.ndarray:
+        """
+        Detect the chess pieces in all cells of the grid at once.
+
+        Equivalent to calling detect_piece on every cell, but converts and
+        measures all cells in single vectorized passes.
+
+        Args:
+            grid: Cell images as an (8, 8, cell_size, cell_size[, channels]) array
+
+        Returns:
+            np.ndarray: (8, 8) array of piece symbols, with '' for empty cells
+        """
+        grid = np.asarray(grid)
+        
+        # Convert all cells to grayscale in one call. Laid out as the board
+        # image, a grid from BoardNormalizer.create_grid is a view of the board
+        # that converts without gathering the cells into a copy first.
+        if grid.ndim == 5:
+            rows, cols, height, width = grid.shape[:4]
+            gray = cv2.cvtColor(
+                grid.swapaxes(1, 2).reshape(rows * height, cols * width, -1),
+                cv2.COLOR_BGR2GRAY,
+            ).reshape(rows, height, cols, width).swapaxes(1, 2)
+        else:
+            gray = grid
+            
+        # Use the single-pass compiled kernel when Numba is installed
+        if NUMBA_AVAILABLE:
+            return _CELL_SYMBOLS[_classify_cells(gray)]
+            
+        # Calculate the average pixel value and standard deviation of each cell
+        avg_values = gray.mean(axis=(2, 3))
+        std_devs = gray.std(axis=(2, 3))
+        
+        # Cells with high standard deviation likely contain a piece, white or
+        # black depending on the average value (placeholder: pawns only)
+        return np.where(std_devs > 40, np.where(avg_values > 128, 'P', 'p'), '')
+
     def detect_piece(self, cell_img: np.ndarray) -> Optional[str]:
         """
         Detect a chess piece in a cell image.
@@ -71,7 +160,7 @@ class PositionExtractor:
         if len(cell_img.shape) == 3:
             gray = cv2.cvtColor(cell_img, cv2.COLOR_BGR2GRAY)
         else:
-            gray = cell_img.copy()
+            gray = cell_img
             
         # Calculate the average pixel value
         avg_value = np.mean(gray)
@@ -114,25 +203,22 @@ class PositionExtractor:
         # Check if the position is valid
         # This is a simplified validation
         
-        # Count pieces
-        piece_counts = {
-            'K': 0, 'Q': 0, 'R': 0, 'B': 0, 'N': 0, 'P': 0,
-            'k': 0, 'q': 0, 'r': 0, 'b': 0, 'n': 0, 'p': 0
-        }
-        
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece:
-                piece_counts[piece.symbol()] += 1
+        # Count pieces with popcounts of the piece-type and color bitboards
+        white = board.occupied_co[chess.WHITE]
+        black = board.occupied_co[chess.BLACK]
+        white_kings = chess.popcount(board.kings & white)
+        black_kings = chess.popcount(board.kings & black)
+        white_pawns = chess.popcount(board.pawns & white)
+        black_pawns = chess.popcount(board.pawns & black)
                 
         # Basic validation rules
-        if piece_counts['K'] != 1 or piece_counts['k'] != 1:
+        if white_kings != 1 or black_kings != 1:
             return False  # Must have exactly one king of each color
             
-        if piece_counts['K'] == 0 or piece_counts['k'] == 0:
+        if white_kings == 0 or black_kings == 0:
             return False  # Both kings must be present
             
-        if piece_counts['P'] > 8 or piece_counts['p'] > 8:
+        if white_pawns > 8 or black_pawns > 8:
             return False  # Maximum 8 pawns per side
             
         # More validation could be added here
@@ -170,28 +256,29 @@ class PositionExtractor:
         height, width = result.shape[:2]
         cell_size = height // 8
         
-        # Draw pieces
-        for row in range(8):
-            for col in range(8):
-                # Convert row, col to chess square (a8 is 0,0)
-                square = chess.square(col, 7 - row)
-                piece = board.piece_at(square)
-                
-                if piece:
-                    # Calculate cell position
-                    x = col * cell_size
-                    y = row * cell_size
-                    
-                    # Draw piece symbol
-                    cv2.putText(
-                        result,
-                        piece.symbol(),
-                        (x + cell_size // 3, y + cell_size // 2),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        1,
-                        (0, 0, 255),
-                        2
-                    )
+        # Text origins indexed by chess square, computed once per cell size
+        origins = self._text_origins.get(cell_size)
+        if origins is None:
+            origins = [None] * 64
+            for row in range(8):
+                for col in range(8):
+                    square = int(_SQUARE_FROM_GRID[row, col])
+                    origins[square] = (col * cell_size + cell_size // 3, row * cell_size + cell_size // 2)
+            self._text_origins[cell_size] = origins
+            
+        # Bind lookups used in the loop to locals
+        piece_at = board.piece_at
+        put_text = cv2.putText
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        
+        # Draw pieces, visiting only occupied squares. Scanning the vertically
+        # flipped occupancy keeps the drawing order row by row from a8, which
+        # decides how overlapping symbols blend on small boards.
+        for flipped_square in chess.scan_forward(chess.flip_vertical(board.occupied)):
+            square = chess.square_mirror(flipped_square)
+            
+            # Draw piece symbol
+            put_text(result, piece_at(square).symbol(), origins[square], font, 1, (0, 0, 255), 2)
                     
         return result
 
@@ -209,9 +296,11 @@ class PositionExtractor:
         # Find differences between the boards
         changes = []
         
+        prev_piece_at = prev_board.piece_at
+        curr_piece_at = curr_board.piece_at
         for square in chess.SQUARES:
-            prev_piece = prev_board.piece_at(square)
-            curr_piece = curr_board.piece_at(square)
+            prev_piece = prev_piece_at(square)
+            curr_piece = curr_piece_at(square)
             
             if prev_piece != curr_piece:
                 changes.append((square, prev_piece, curr_piece))
@@ -2,8 +2,18 @@
 Chess position validation module for chess video analyzer.
 """
 
+import operator
+from collections import OrderedDict
+
 import chess
-from typing import Dict, List, Optional, Tuple
+from typing import Hashable, List, Optional, Tuple
+
+# Number of recently seen positions whose validation results are kept
+VALIDATION_CACHE_SIZE = 128
+
+# Material values laid out like the piece counts (index color * 7 + piece_type),
+# negated for black so that one dot product gives white's material advantage
+_MATERIAL_WEIGHTS = (0, -1, -3, -3, -5, -9, 0, 0, 1, 3, 3, 5, 9, 0)
 
 
 class PositionValidator:
@@ -15,12 +25,69 @@ class PositionValidator:
         """
         Initialize the position validator.
         """
-        pass
+        # Results for recently validated positions, least recently used first
+        self._validation_cache = OrderedDict()
+        self._reasonable_cache = OrderedDict()
 
     def validate_position(self, board: chess.Board) -> Tuple[bool, List[str]]:
         """
         Validate a chess position using chess rules.
 
+        Video frames show the same position many times in a row, so results
+        for recently validated positions are reused.
+
+        Args:
+            board: Chess board
+
+        Returns:
+            Tuple[bool, List[str]]: Validation result and list of issues
+        """
+        key = self._position_key(board)
+        cached = self._validation_cache.get(key)
+        if cached is not None:
+            self._validation_cache.move_to_end(key)
+            is_valid, issues = cached
+            return is_valid, list(issues)
+            
+        is_valid, issues = self._validate_position(board)
+        self._cache_result(self._validation_cache, key, (is_valid, tuple(issues)))
+        
+        return is_valid, issues
+
+    @staticmethod
+    def _position_key(board: chess.Board) -> Hashable:
+        """
+        Get a key for the parts of a position that validation depends on.
+
+        Args:
+            board: Chess board
+
+        Returns:
+            Hashable: Piece placement and side to move
+        """
+        return (
+            board.pawns, board.knights, board.bishops, board.rooks, board.queens, board.kings,
+            board.occupied_co[chess.WHITE], board.occupied_co[chess.BLACK], board.turn,
+        )
+
+    @staticmethod
+    def _cache_result(cache: OrderedDict, key: Hashable, result) -> None:
+        """
+        Store a result, evicting the least recently used one if the cache is full.
+
+        Args:
+            cache: Result cache
+            key: Position key
+            result: Result to store
+        """
+        cache[key] = result
+        if len(cache) > VALIDATION_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _validate_position(self, board: chess.Board) -> Tuple[bool, List[str]]:
+        """
+        Validate a chess position using chess rules, without the result cache.
+
         Args:
             board: Chess board
 
@@ -29,12 +96,15 @@ class PositionValidator:
         """
         issues = []
         
+        # Count pieces once for the king and piece count checks
+        piece_counts = self._count_pieces(board)
+        
         # Check kings
-        if not self._validate_kings(board, issues):
+        if not self._validate_kings(piece_counts, issues):
             return False, issues
             
         # Check piece counts
-        if not self._validate_piece_counts(board, issues):
+        if not self._validate_piece_counts(piece_counts, issues):
             return False, issues
             
         # Check pawn placement
@@ -47,27 +117,42 @@ class PositionValidator:
             
         return len(issues) == 0, issues
 
-    def _validate_kings(self, board: chess.Board, issues: List[str]) -> bool:
+    @staticmethod
+    def _count_pieces(board: chess.Board) -> bytearray:
         """
-        Validate that there is exactly one king of each color.
+        Count the pieces of each type and color.
 
         Args:
             board: Chess board
+
+        Returns:
+            bytearray: Piece counts indexed by color * 7 + piece_type, so black
+            pieces are counted at 1-6 and white pieces at 8-13
+        """
+        # Count pieces from their bitboards, black first (index 0 and 7 unused)
+        white = board.occupied_co[chess.WHITE]
+        black = board.occupied_co[chess.BLACK]
+        bitboards = (board.pawns, board.knights, board.bishops, board.rooks, board.queens, board.kings)
+        popcount = chess.popcount
+        
+        return bytearray((
+            0, *[popcount(bb & black) for bb in bitboards],
+            0, *[popcount(bb & white) for bb in bitboards],
+        ))
+
+    def _validate_kings(self, piece_counts: bytearray, issues: List[str]) -> bool:
+        """
+        Validate that there is exactly one king of each color.
+
+        Args:
+            piece_counts: Piece counts indexed by color * 7 + piece_type
             issues: List to append issues to
 
         Returns:
             bool: True if valid, False otherwise
         """
-        white_king_count = 0
-        black_king_count = 0
-        
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece and piece.piece_type == chess.KING:
-                if piece.color == chess.WHITE:
-                    white_king_count += 1
-                else:
-                    black_king_count += 1
+        white_king_count = piece_counts[chess.WHITE * 7 + chess.KING]
+        black_king_count = piece_counts[chess.BLACK * 7 + chess.KING]
                     
         if white_king_count != 1:
             issues.append(f"Invalid white king count: {white_king_count}")
@@ -79,75 +164,51 @@ class PositionValidator:
             
         return True
 
-    def _validate_piece_counts(self, board: chess.Board, issues: List[str]) -> bool:
+    def _validate_piece_counts(self, piece_counts: bytearray, issues: List[str]) -> bool:
         """
         Validate that piece counts are within legal limits.
 
         Args:
-            board: Chess board
+            piece_counts: Piece counts indexed by color * 7 + piece_type
             issues: List to append issues to
 
         Returns:
             bool: True if valid, False otherwise
         """
-        # Count pieces by type and color
-        piece_counts = {
-            chess.WHITE: {
-                chess.PAWN: 0,
-                chess.KNIGHT: 0,
-                chess.BISHOP: 0,
-                chess.ROOK: 0,
-                chess.QUEEN: 0,
-                chess.KING: 0
-            },
-            chess.BLACK: {
-                chess.PAWN: 0,
-                chess.KNIGHT: 0,
-                chess.BISHOP: 0,
-                chess.ROOK: 0,
-                chess.QUEEN: 0,
-                chess.KING: 0
-            }
-        }
-        
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece:
-                piece_counts[piece.color][piece.piece_type] += 1
-                
         # Check piece counts
         valid = True
         
         # Pawns: 0-8 per side
         for color in [chess.WHITE, chess.BLACK]:
             color_name = "white" if color == chess.WHITE else "black"
+            base = color * 7
             
-            if piece_counts[color][chess.PAWN] > 8:
-                issues.append(f"Too many {color_name} pawns: {piece_counts[color][chess.PAWN]}")
+            if piece_counts[base + chess.PAWN] > 8:
+                issues.append(f"Too many {color_name} pawns: {piece_counts[base + chess.PAWN]}")
                 valid = False
                 
             # Knights: 0-10 per side (8 pawns could be promoted)
-            if piece_counts[color][chess.KNIGHT] > 10:
-                issues.append(f"Too many {color_name} knights: {piece_counts[color][chess.KNIGHT]}")
+            if piece_counts[base + chess.KNIGHT] > 10:
+                issues.append(f"Too many {color_name} knights: {piece_counts[base + chess.KNIGHT]}")
                 valid = False
                 
             # Bishops: 0-10 per side
-            if piece_counts[color][chess.BISHOP] > 10:
-                issues.append(f"Too many {color_name} bishops: {piece_counts[color][chess.BISHOP]}")
+            if piece_counts[base + chess.BISHOP] > 10:
+                issues.append(f"Too many {color_name} bishops: {piece_counts[base + chess.BISHOP]}")
                 valid = False
                 
             # Rooks: 0-10 per side
-            if piece_counts[color][chess.ROOK] > 10:
-                issues.append(f"Too many {color_name} rooks: {piece_counts[color][chess.ROOK]}")
+            if piece_counts[base + chess.ROOK] > 10:
+                issues.append(f"Too many {color_name} rooks: {piece_counts[base + chess.ROOK]}")
                 valid = False
                 
             # Queens: 0-9 per side
-            if piece_counts[color][chess.QUEEN] > 9:
-                issues.append(f"Too many {color_name} queens: {piece_counts[color][chess.QUEEN]}")
+            if piece_counts[base + chess.QUEEN] > 9:
+                issues.append(f"Too many {color_name} queens: {piece_counts[base + chess.QUEEN]}")
                 valid = False
                 
             # Total pieces: max 16 per side
-            total_pieces = sum(piece_counts[color].values())
+            total_pieces = sum(piece_counts[base + chess.PAWN:base + chess.KING + 1])
             if total_pieces > 16:
                 issues.append(f"Too many {color_name} pieces: {total_pieces}")
                 valid = False
@@ -165,25 +226,19 @@ class PositionValidator:
         Returns:
             bool: True if valid, False otherwise
         """
-        valid = True
-        
+        # Valid positions have no pawns on either back rank
+        if not board.pawns & chess.BB_BACKRANKS:
+            return True
+            
         # Check for pawns on first rank
-        for file_idx in range(8):
-            square = chess.square(file_idx, 0)  # a1, b1, ..., h1
-            piece = board.piece_at(square)
-            if piece and piece.piece_type == chess.PAWN:
-                issues.append(f"Pawn on first rank at {chess.square_name(square)}")
-                valid = False
+        for square in chess.scan_forward(board.pawns & chess.BB_RANK_1):
+            issues.append(f"Pawn on first rank at {chess.square_name(square)}")
                 
         # Check for pawns on last rank
-        for file_idx in range(8):
-            square = chess.square(file_idx, 7)  # a8, b8, ..., h8
-            piece = board.piece_at(square)
-            if piece and piece.piece_type == chess.PAWN:
-                issues.append(f"Pawn on last rank at {chess.square_name(square)}")
-                valid = False
+        for square in chess.scan_forward(board.pawns & chess.BB_RANK_8):
+            issues.append(f"Pawn on last rank at {chess.square_name(square)}")
                 
-        return valid
+        return False
 
     def _validate_check_state(self, board: chess.Board, issues: List[str]) -> bool:
         """
@@ -196,16 +251,11 @@ class PositionValidator:
         Returns:
             bool: True if valid, False otherwise
         """
-        # Check if the side not to move is in check
-        side_to_move = board.turn
-        board.turn = not side_to_move
-        
-        if board.is_check():
+        # Check if the side not to move is in check, without flipping board.turn
+        if board.was_into_check():
             issues.append(f"The side not to move is in check")
-            board.turn = side_to_move
             return False
             
-        board.turn = side_to_move
         return True
 
     def suggest_corrections(self, board: chess.Board) -> chess.Board:
@@ -228,6 +278,27 @@ class PositionValidator:
         """
         Check if the position is reasonable for a real game.
 
+        Args:
+            board: Chess board
+
+        Returns:
+            bool: True if reasonable, False otherwise
+        """
+        key = self._position_key(board)
+        cached = self._reasonable_cache.get(key)
+        if cached is not None:
+            self._reasonable_cache.move_to_end(key)
+            return cached
+            
+        result = self._is_reasonable_position(board)
+        self._cache_result(self._reasonable_cache, key, result)
+        
+        return result
+
+    def _is_reasonable_position(self, board: chess.Board) -> bool:
+        """
+        Check if the position is reasonable for a real game, without the result cache.
+
         Args:
             board: Chess board
 
@@ -237,54 +308,16 @@ class PositionValidator:
         # This is a simplified check for a reasonable position
         
         # Count pieces
-        piece_counts = {
-            chess.WHITE: {
-                chess.PAWN: 0,
-                chess.KNIGHT: 0,
-                chess.BISHOP: 0,
-                chess.ROOK: 0,
-                chess.QUEEN: 0,
-                chess.KING: 0
-            },
-            chess.BLACK: {
-                chess.PAWN: 0,
-                chess.KNIGHT: 0,
-                chess.BISHOP: 0,
-                chess.ROOK: 0,
-                chess.QUEEN: 0,
-                chess.KING: 0
-            }
-        }
-        
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece:
-                piece_counts[piece.color][piece.piece_type] += 1
+        piece_counts = self._count_pieces(board)
                 
         # Check if the position is reasonable
         
         # Both sides should have kings
-        if piece_counts[chess.WHITE][chess.KING] != 1 or piece_counts[chess.BLACK][chess.KING] != 1:
+        if piece_counts[chess.WHITE * 7 + chess.KING] != 1 or piece_counts[chess.BLACK * 7 + chess.KING] != 1:
             return False
             
         # Material difference should not be too extreme
-        white_material = (
-            piece_counts[chess.WHITE][chess.PAWN] * 1 +
-            piece_counts[chess.WHITE][chess.KNIGHT] * 3 +
-            piece_counts[chess.WHITE][chess.BISHOP] * 3 +
-            piece_counts[chess.WHITE][chess.ROOK] * 5 +
-            piece_counts[chess.WHITE][chess.QUEEN] * 9
-        )
-        
-        black_material = (
-            piece_counts[chess.BLACK][chess.PAWN] * 1 +
-            piece_counts[chess.BLACK][chess.KNIGHT] * 3 +
-            piece_counts[chess.BLACK][chess.BISHOP] * 3 +
-            piece_counts[chess.BLACK][chess.ROOK] * 5 +
-            piece_counts[chess.BLACK][chess.QUEEN] * 9
-        )
-        
-        material_diff = abs(white_material - black_material)
+        material_diff = abs(sum(map(operator.mul, piece_counts, _MATERIAL_WEIGHTS)))
         
         # If material difference is too large, it's probably an error
         if material_diff > 15:
@@ -0,0 +1,20 @@
+"""
+Optional Numba JIT support for chess video analyzer.
+"""
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """
+        Return the function unchanged when Numba is not installed.
+
+        Supports both the @njit and @njit(...) decorator forms.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
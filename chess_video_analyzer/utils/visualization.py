@@ -23,56 +23,128 @@ class Visualizer:
         self.board_size = board_size
         self.cell_size = board_size // 8
         
+        # Top-left pixel coordinates of each square (a8 is drawn at 0,0)
+        self._square_x = tuple(chess.square_file(square) * self.cell_size for square in chess.SQUARES)
+        self._square_y = tuple((7 - chess.square_rank(square)) * self.cell_size for square in chess.SQUARES)
+        
         # Colors
         self.white_color = (240, 240, 240)
         self.black_color = (125, 135, 150)
         self.highlight_color = (0, 255, 0)
         self.text_color = (0, 0, 0)
         self.move_color = (0, 0, 255)
+        
+        # Checkered background, painted once and copied for every board
+        self._board_bg = self._build_background()
+        
+        # Pre-rendered piece cells, or None when glyphs spill over cell edges
+        self._piece_tiles = self._build_piece_tiles()
+        
+        # Coordinate labels and their text origins
+        self._coord_labels = self._build_coordinate_labels()
+        
+        # Rendered text overlay boxes keyed by text
+        self._text_patches = {}
 
-    def draw_board(self, board: chess.Board) -> np.ndarray:
+    def draw_board(self, board: chess.Board, dst: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Draw a chess board visualization.
 
         Args:
             board: Chess board
+            dst: Optional image to draw into, reused if it has the board's shape
 
         Returns:
             np.ndarray: Board visualization image
         """
-        # Create empty board image
+        # Start from the cached checkered background
+        if dst is not None and dst.shape == self._board_bg.shape and dst.dtype == np.uint8:
+            board_img = dst
+            np.copyto(board_img, self._board_bg)
+        else:
+            board_img = self._board_bg.copy()
+                
+        # Draw pieces, visiting only occupied squares. In the vertically flipped
+        # occupancy a8 is bit 0, so bits map directly to (row, col) and the
+        # drawing order stays row by row from a8, which decides how outlines
+        # of neighbouring pieces overlap on small boards.
+        piece_at = board.piece_at
+        cell_size = self.cell_size
+        square_x = self._square_x
+        square_y = self._square_y
+        tiles = self._piece_tiles
+        for flipped_square in chess.scan_forward(chess.flip_vertical(board.occupied)):
+            square = chess.square_mirror(flipped_square)
+            piece = piece_at(square)
+            x = square_x[square]
+            y = square_y[square]
+            
+            if tiles is not None:
+                # Copy the pre-rendered cell instead of rasterizing the glyph.
+                # Dark cells are those where row + col is odd.
+                dark = ((flipped_square >> 3) + flipped_square) & 1
+                board_img[y:y + cell_size, x:x + cell_size] = tiles[piece.symbol(), dark]
+            else:
+                self._draw_piece(board_img, piece, x, y)
+                    
+        return board_img
+
+    def _build_background(self) -> np.ndarray:
+        """
+        Build the checkered board background without pieces.
+
+        Returns:
+            np.ndarray: Board background image
+        """
         board_img = np.zeros((self.board_size, self.board_size, 3), dtype=np.uint8)
         
-        # Draw cells
-        for row in range(8):
-            for col in range(8):
-                x1 = col * self.cell_size
-                y1 = row * self.cell_size
-                x2 = x1 + self.cell_size
-                y2 = y1 + self.cell_size
+        # Cell index of each pixel row/column. Cells are drawn with their far
+        # edge included, so the last cell extends one pixel past 8 * cell_size
+        # when the board is large enough to hold it.
+        extent = min(8 * self.cell_size + 1, self.board_size)
+        cells = np.minimum(np.arange(extent) // max(self.cell_size, 1), 7)
+        
+        # Light cells where row + col is even, dark cells elsewhere
+        dark = (cells[:, None] + cells[None, :]) % 2
+        colors = np.array([self.white_color, self.black_color], dtype=np.uint8)
+        board_img[:extent, :extent] = colors[dark]
+        
+        return board_img
+
+    def _build_piece_tiles(self) -> Optional[Dict[Tuple[str, int], np.ndarray]]:
+        """
+        Pre-render every piece on both cell colors.
+
+        A tile is the whole cell with the piece drawn on it, so copying it into
+        the board gives the same pixels as drawing the piece there. This only
+        holds when every glyph stays inside its cell; on boards too small for
+        that, pieces are drawn directly and None is returned.
+
+        Returns:
+            Optional[Dict[Tuple[str, int], np.ndarray]]: Cell tiles keyed by
+            piece symbol and cell color (0 for light, 1 for dark), or None
+        """
+        cell = self.cell_size
+        if cell < 1:
+            return None
+            
+        tiles = {}
+        for dark, color in enumerate((self.white_color, self.black_color)):
+            for symbol in "PNBRQKpnbrqk":
+                # Draw on a padded canvas so that spill over the cell shows up
+                canvas = np.empty((3 * cell, 3 * cell, 3), dtype=np.uint8)
+                canvas[:] = color
+                self._draw_piece(canvas, chess.Piece.from_symbol(symbol), cell, cell)
                 
-                # Determine cell color
-                if (row + col) % 2 == 0:
-                    color = self.white_color
-                else:
-                    color = self.black_color
+                tile = canvas[cell:2 * cell, cell:2 * cell].copy()
+                canvas[cell:2 * cell, cell:2 * cell] = color
+                if (canvas != np.array(color, dtype=np.uint8)).any():
+                    return None
                     
-                # Draw cell
-                cv2.rectangle(board_img, (x1, y1), (x2, y2), color, -1)
+                tile.flags.writeable = False
+                tiles[symbol, dark] = tile
                 
-        # Draw pieces
-        for row in range(8):
-            for col in range(8):
-                # Convert to chess square (a8 is 0,0)
-                square = chess.square(col, 7 - row)
-                piece = board.piece_at(square)
-                
-                if piece:
-                    x = col * self.cell_size
-                    y = row * self.cell_size
-                    self._draw_piece(board_img, piece, x, y)
-                    
-        return board_img
+        return tiles
 
     def _draw_piece(self, img: np.ndarray, piece: chess.Piece, x: int, y: int) -> None:
         """
@@ -110,7 +182,9 @@ class Visualizer:
             
         cv2.putText(img, symbol, (text_x, text_y), font, font_scale, text_color, thickness)
 
-    def highlight_square(self, img: np.ndarray, square: chess.Square, color: Tuple[int, int, int] = None) -> np.ndarray:
+    def highlight_square(
+        self, img: np.ndarray, square: chess.Square, color: Tuple[int, int, int] = None, inplace: bool = False
+    ) -> np.ndarray:
         """
         Highlight a square on the board image.
 
@@ -118,6 +192,7 @@ class Visualizer:
             img: Board image
             square: Chess square
             color: Highlight color (default: self.highlight_color)
+            inplace: Draw directly on the input image instead of a copy
 
         Returns:
             np.ndarray: Board image with highlighted square
@@ -126,53 +201,45 @@ class Visualizer:
             color = self.highlight_color
             
         # Get square coordinates
-        col = chess.square_file(square)
-        row = 7 - chess.square_rank(square)
-        
-        x1 = col * self.cell_size
-        y1 = row * self.cell_size
+        x1 = self._square_x[square]
+        y1 = self._square_y[square]
         x2 = x1 + self.cell_size
         y2 = y1 + self.cell_size
         
-        # Create a copy of the image
-        result = img.copy()
+        # Draw on a copy of the image unless asked to draw in place
+        result = img if inplace else img.copy()
         
         # Draw highlight
         cv2.rectangle(result, (x1, y1), (x2, y2), color, 3)
         
         return result
 
-    def highlight_move(self, img: np.ndarray, move: chess.Move) -> np.ndarray:
+    def highlight_move(self, img: np.ndarray, move: chess.Move, inplace: bool = False) -> np.ndarray:
         """
         Highlight a move on the board image.
 
         Args:
             img: Board image
             move: Chess move
+            inplace: Draw directly on the input image instead of a copy
 
         Returns:
             np.ndarray: Board image with highlighted move
         """
-        # Create a copy of the image
-        result = img.copy()
+        # Draw on a copy of the image unless asked to draw in place
+        result = img if inplace else img.copy()
         
         # Highlight from square
-        from_col = chess.square_file(move.from_square)
-        from_row = 7 - chess.square_rank(move.from_square)
-        
-        from_x1 = from_col * self.cell_size
-        from_y1 = from_row * self.cell_size
+        from_x1 = self._square_x[move.from_square]
+        from_y1 = self._square_y[move.from_square]
         from_x2 = from_x1 + self.cell_size
         from_y2 = from_y1 + self.cell_size
         
         cv2.rectangle(result, (from_x1, from_y1), (from_x2, from_y2), self.move_color, 3)
         
         # Highlight to square
-        to_col = chess.square_file(move.to_square)
-        to_row = 7 - chess.square_rank(move.to_square)
-        
-        to_x1 = to_col * self.cell_size
-        to_y1 = to_row * self.cell_size
+        to_x1 = self._square_x[move.to_square]
+        to_y1 = self._square_y[move.to_square]
         to_x2 = to_x1 + self.cell_size
         to_y2 = to_y1 + self.cell_size
         
@@ -188,38 +255,58 @@ class Visualizer:
         
         return result
 
-    def draw_coordinates(self, img: np.ndarray) -> np.ndarray:
+    def draw_coordinates(self, img: np.ndarray, inplace: bool = False) -> np.ndarray:
         """
         Draw board coordinates on the image.
 
         Args:
             img: Board image
+            inplace: Draw directly on the input image instead of a copy
 
         Returns:
             np.ndarray: Board image with coordinates
         """
-        # Create a copy of the image
-        result = img.copy()
+        # Draw on a copy of the image unless asked to draw in place
+        result = img if inplace else img.copy()
         
-        # Draw file coordinates (a-h)
+        # Draw file (a-h) and rank (1-8) coordinates
+        for label, origin in self._coord_labels:
+            cv2.putText(result, label, origin, cv2.FONT_HERSHEY_SIMPLEX, 0.5, self.text_color, 1)
+            
+        return result
+
+    def _build_coordinate_labels(self) -> List[Tuple[str, Tuple[int, int]]]:
+        """
+        Build the coordinate labels and their text origins.
+
+        Returns:
+            List[Tuple[str, Tuple[int, int]]]: Label text and origin pairs
+        """
+        labels = []
+        
+        # File coordinates (a-h)
         for col in range(8):
             file_label = chr(ord('a') + col)
             x = col * self.cell_size + self.cell_size // 2
             y = self.board_size - 5
+            labels.append((file_label, (x - 5, y)))
             
-            cv2.putText(result, file_label, (x - 5, y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, self.text_color, 1)
-            
-        # Draw rank coordinates (1-8)
+        # Rank coordinates (1-8)
         for row in range(8):
             rank_label = str(8 - row)
             x = 5
             y = row * self.cell_size + self.cell_size // 2 + 5
+            labels.append((rank_label, (x, y)))
             
-            cv2.putText(result, rank_label, (x, y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, self.text_color, 1)
-            
-        return result
+        return labels
 
-    def create_side_by_side(self, img1: np.ndarray, img2: np.ndarray, labels: Optional[Tuple[str, str]] = None) -> np.ndarray:
+    def create_side_by_side(
+        self,
+        img1: np.ndarray,
+        img2: np.ndarray,
+        labels: Optional[Tuple[str, str]] = None,
+        dst: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
         """
         Create a side-by-side visualization of two images.
 
@@ -227,6 +314,7 @@ class Visualizer:
             img1: First image
             img2: Second image
             labels: Optional labels for the images
+            dst: Optional image to compose into, reused if it has the result's shape
 
         Returns:
             np.ndarray: Side-by-side visualization
@@ -249,7 +337,12 @@ class Visualizer:
         h1, w1 = img1.shape[:2]
         h2, w2 = img2.shape[:2]
         
-        result = np.zeros((target_height, w1 + w2, 3), dtype=np.uint8)
+        # Both halves are copied over the whole image, so it needs no clearing
+        shape = (target_height, w1 + w2, 3)
+        if dst is not None and dst.shape == shape and dst.dtype == np.uint8:
+            result = dst
+        else:
+            result = np.empty(shape, dtype=np.uint8)
         result[:, :w1] = img1
         result[:, w1:w1+w2] = img2
         
@@ -262,7 +355,9 @@ class Visualizer:
             
         return result
 
-    def add_text_overlay(self, img: np.ndarray, text: str, position: Tuple[int, int] = None) -> np.ndarray:
+    def add_text_overlay(
+        self, img: np.ndarray, text: str, position: Tuple[int, int] = None, inplace: bool = False
+    ) -> np.ndarray:
         """
         Add a text overlay to an image.
 
@@ -270,17 +365,45 @@ class Visualizer:
             img: Input image
             text: Text to add
             position: Position of the text (default: bottom-left)
+            inplace: Draw directly on the input image instead of a copy
 
         Returns:
             np.ndarray: Image with text overlay
         """
-        # Create a copy of the image
-        result = img.copy()
+        # Draw on a copy of the image unless asked to draw in place
+        result = img if inplace else img.copy()
         
         # Set default position if not provided
         if position is None:
             position = (10, img.shape[0] - 20)
             
+        text_x, text_y = position
+        
+        # Paste the cached overlay box, rewriting only the pixels it covers
+        patch = self._text_patch(text)
+        if patch is not None:
+            height, width = result.shape[:2]
+            x1, y1 = text_x - 5, text_y + 5 - patch.shape[0] + 1
+            x2, y2 = x1 + patch.shape[1], y1 + patch.shape[0]
+            cx1, cy1 = max(x1, 0), max(y1, 0)
+            cx2, cy2 = min(x2, width), min(y2, height)
+            if cx1 < cx2 and cy1 < cy2:
+                result[cy1:cy2, cx1:cx2] = patch[cy1 - y1:cy2 - y1, cx1 - x1:cx2 - x1]
+            return result
+            
+        self._draw_text_box(result, text, position)
+        
+        return result
+
+    def _draw_text_box(self, img: np.ndarray, text: str, position: Tuple[int, int]) -> None:
+        """
+        Draw text on a black box.
+
+        Args:
+            img: Image to draw on
+            text: Text to draw
+            position: Position of the text
+        """
         # Add text background for better visibility
         font = cv2.FONT_HERSHEY_SIMPLEX
         font_scale = 0.7
@@ -290,7 +413,7 @@ class Visualizer:
         text_x, text_y = position
         
         cv2.rectangle(
-            result,
+            img,
             (text_x - 5, text_y - text_size[1] - 5),
             (text_x + text_size[0] + 5, text_y + 5),
             (0, 0, 0),
@@ -298,6 +421,43 @@ class Visualizer:
         )
         
         # Add text
-        cv2.putText(result, text, position, font, font_scale, (255, 255, 255), thickness)
+        cv2.putText(img, text, position, font, font_scale, (255, 255, 255), thickness)
+
+    def _text_patch(self, text: str) -> Optional[np.ndarray]:
+        """
+        Get the rendered text box for a text overlay.
+
+        The box is opaque, so when the text stays inside it the overlay does not
+        depend on the image underneath and can be rendered once and pasted.
+        Video overlays repeat the same text over many frames.
+
+        Args:
+            text: Text to draw
+
+        Returns:
+            Optional[np.ndarray]: Rendered box, or None if the text spills over it
+        """
+        if text in self._text_patches:
+            return self._text_patches[text]
+            
+        text_width, text_height = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2)[0]
+        box_width, box_height = text_width + 11, text_height + 11
         
-        return result
+        # Draw on a padded canvas so that spill over the box shows up
+        margin = text_height + 5
+        canvas = np.zeros((box_height + 2 * margin, box_width + 2 * margin, 3), dtype=np.uint8)
+        self._draw_text_box(canvas, text, (margin + 5, margin + text_height + 5))
+        
+        patch = canvas[margin:margin + box_height, margin:margin + box_width].copy()
+        canvas[margin:margin + box_height, margin:margin + box_width] = 0
+        if canvas.any():
+            patch = None
+        else:
+            patch.flags.writeable = False
+            
+        # Keep the cache small; overlay texts change as the game goes on
+        if len(self._text_patches) >= 64:
+            self._text_patches.clear()
+        self._text_patches[text] = patch
+        
+        return patch
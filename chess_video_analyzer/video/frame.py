@@ -4,7 +4,7 @@ Frame extraction and processing module for chess video analyzer.
 
 import cv2
 import numpy as np
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 
 class FrameExtractor:
@@ -65,14 +65,89 @@ class FrameExtractor:
         Returns:
             List[np.ndarray]: Processed frames
         """
-        processed_frames = []
+        selected = frames[::self.frame_interval]
         
-        for i, frame in enumerate(frames):
-            if i % self.frame_interval == 0:
-                processed_frame = self.process_frame(frame)
-                processed_frames.append(processed_frame)
+        # Without resizing, processing leaves frames unchanged
+        if self.resize_dim is None:
+            if any(frame is None for frame in selected):
+                raise ValueError("Frame cannot be None")
+            return list(selected)
+            
+        return [self.process_frame(frame) for frame in selected]
+
+    def extract_frames_batch(self, frames: List[np.ndarray]) -> np.ndarray:
+        """
+        Extract and process frames at the specified interval into one array.
+
+        Frames are resized straight into a preallocated batch, so no
+        intermediate array is created per frame.
+
+        Args:
+            frames: List of input frames, all of the same shape. At least one
+                frame is required, as the batch takes its shape from them.
+
+        Returns:
+            np.ndarray: Processed frames stacked along the first axis
+        """
+        if len(frames) == 0:
+            raise ValueError("Frames cannot be empty")
+            
+        selected = frames[::self.frame_interval]
+        if any(frame is None for frame in selected):
+            raise ValueError("Frame cannot be None")
+            
+        first = selected[0]
+        if self.resize_dim is None:
+            height, width = first.shape[:2]
+        else:
+            width, height = self.resize_dim
+            
+        batch = np.empty((len(selected), height, width) + first.shape[2:], dtype=first.dtype)
+        
+        for i, frame in enumerate(selected):
+            if self.resize_dim is None:
+                batch[i] = frame
+            else:
+                cv2.resize(frame, self.resize_dim, dst=batch[i])
                 
-        return processed_frames
+        return batch
+
+    def process_batch(
+        self, frames: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Process a batch of frames (resize, enhance, etc.).
+
+        Equivalent to calling process_frame on every frame, with the results
+        written into a single array, e.g. for frames read with
+        VideoInput.get_frames_array.
+
+        Args:
+            frames: Frames stacked along the first axis
+            out: Optional array for the processed frames, reused if it has the
+                processed batch's shape and type
+
+        Returns:
+            np.ndarray: Processed frames stacked along the first axis
+        """
+        if frames is None:
+            raise ValueError("Frames cannot be None")
+            
+        # Without resizing, processing leaves frames unchanged
+        if self.resize_dim is None:
+            return frames
+            
+        width, height = self.resize_dim
+        shape = (len(frames), height, width) + frames.shape[3:]
+        if out is None or out.shape != shape or out.dtype != frames.dtype:
+            out = np.empty(shape, dtype=frames.dtype)
+            
+        # Each frame is resized on its own, as interpolating across a stacked
+        # image would blend rows of neighbouring frames
+        for frame, processed in zip(frames, out):
+            cv2.resize(frame, self.resize_dim, dst=processed)
+            
+        return out
 
     @staticmethod
     def enhance_frame(frame: np.ndarray) -> np.ndarray:
@@ -88,34 +163,52 @@ class FrameExtractor:
         # Convert to grayscale
         gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
         
-        # Apply Gaussian blur to reduce noise
-        blurred = cv2.GaussianBlur(gray, (5, 5), 0)
+        # Apply Gaussian blur to reduce noise. Both filters run in place on the
+        # grayscale buffer, so it is the only image allocated per frame.
+        cv2.GaussianBlur(gray, (5, 5), 0, dst=gray)
         
         # Apply adaptive thresholding
-        thresh = cv2.adaptiveThreshold(
-            blurred, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
+        cv2.adaptiveThreshold(
+            gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2, dst=gray
         )
         
-        return thresh
+        return gray
 
     @staticmethod
-    def extract_key_frames(frames: List[np.ndarray], max_frames: int = 10) -> List[np.ndarray]:
+    def extract_key_frames(
+        frames: List[np.ndarray], max_frames: int = 10, as_array: bool = False
+    ) -> Union[List[np.ndarray], np.ndarray]:
         """
         Extract key frames from a list of frames.
 
         Args:
             frames: List of input frames
             max_frames: Maximum number of frames to extract
+            as_array: Return the key frames stacked into one array, copied
+                straight into place, instead of as a list. At least one frame
+                is then required, as the array takes its shape from them.
 
         Returns:
-            List[np.ndarray]: Key frames
+            Union[List[np.ndarray], np.ndarray]: Key frames
         """
-        if not frames:
+        if len(frames) == 0:
+            if as_array:
+                raise ValueError("Frames cannot be empty")
             return []
             
         if len(frames) <= max_frames:
-            return frames
+            indices = range(len(frames))
+            if not as_array:
+                return frames
+        else:
+            # Simple approach: take evenly spaced frames
+            indices = np.linspace(0, len(frames) - 1, max_frames, dtype=int)
+            if not as_array:
+                return [frames[i] for i in indices]
+                
+        first = frames[0]
+        key_frames = np.empty((len(indices),) + first.shape, dtype=first.dtype)
+        for j, i in enumerate(indices):
+            key_frames[j] = frames[i]
             
-        # Simple approach: take evenly spaced frames
-        indices = np.linspace(0, len(frames) - 1, max_frames, dtype=int)
-        return [frames[i] for i in indices]
+        return key_frames
@@ -2,26 +2,76 @@
 Video input handling module for chess video analyzer.
 """
 
+import queue
+import threading
+
 import cv2
 import numpy as np
 from pathlib import Path
 from typing import Iterator, Optional, Tuple
 
+try:
+    import av
+except ImportError:
+    av = None  # PyAV is optional; the OpenCV backend is used without it
+
+# Default number of frames decoded ahead of the consumer in get_frames
+FRAME_PREFETCH = 8
+
+# Decoding backends for get_frames
+VIDEO_BACKENDS = ("opencv", "pyav")
+
+# URL schemes of live network streams, whose frames should be read as they arrive
+LIVE_STREAM_SCHEMES = ("rtsp://", "rtmp://", "http://", "https://", "udp://", "tcp://")
+
 
 class VideoInput:
     """
     Handles video input from files or streams.
     """
 
-    def __init__(self, source: str):
+    def __init__(
+        self,
+        source: str,
+        hw_decode: bool = False,
+        frame_buffers: int = 0,
+        low_latency: bool = False,
+        backend: str = "opencv",
+    ):
         """
         Initialize the video input handler.
 
         Args:
             source: Path to video file or stream URL
+            hw_decode: Decode on the GPU with cv2.cudacodec when available
+            frame_buffers: Decode into a ring of this many preallocated frames
+                instead of a new array per frame (0 to disable). The buffers are
+                page-locked when a CUDA device is present, so that uploads to the
+                GPU can run asynchronously. A returned frame is overwritten once
+                frame_buffers more frames have been read.
+            low_latency: Limit the capture's internal buffer to a single frame for
+                cameras (integer device indices) and network streams, so that
+                get_frame returns the latest frame rather than one that has been
+                queued. Has no effect on video files.
+            backend: Decoder used by get_frames, "opencv" or "pyav". PyAV lets
+                FFmpeg decode with frame and slice threads on all cores. It needs
+                the optional av package, does not use frame_buffers and does not
+                open camera indices; OpenCV is used in those cases.
         """
+        if backend not in VIDEO_BACKENDS:
+            raise ValueError(f"Unknown video backend {backend!r}, expected one of {VIDEO_BACKENDS}")
+
         self.source = source
+        self.hw_decode = hw_decode
+        self.frame_buffers = frame_buffers
+        self.low_latency = low_latency
+        self.backend = backend
+        self._buffers = []  # Ring of preallocated frames used by get_frame
+        self._buffer_index = 0
+        self._pinned = False
         self.cap = None
+        self.reader = None  # GPU video reader when hardware decoding is active
+        self._gpu_frame = None  # Frame last grabbed from the GPU reader
         self.width = 0
         self.height = 0
         self.fps = 0
@@ -35,63 +85,427 @@ class VideoInput:
             bool: True if successful, False otherwise
         """
         try:
-            self.cap = cv2.VideoCapture(self.source)
+            self.cap = self._open_capture()
             if not self.cap.isOpened():
                 print(f"Error: Could not open video source {self.source}")
                 return False
 
+            if self.low_latency and self._is_live_source(self.source):
+                self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
             # Get video properties
             self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
             self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
             self.fps = self.cap.get(cv2.CAP_PROP_FPS)
             self.frame_count = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
 
+            if self.backend == "pyav" and av is None:
+                print("Warning: PyAV is not installed, using OpenCV decoding")
+
+            if self.hw_decode:
+                self._open_hw_reader()
+
+            if self.frame_buffers > 0 and self.reader is None:
+                self._allocate_buffers()
+
             return True
         except Exception as e:
             print(f"Error opening video source: {e}")
             return False
 
+    def _open_capture(self) -> cv2.VideoCapture:
+        """
+        Open the video source with the FFmpeg backend, letting it decode on the
+        GPU (NVDEC, VAAPI, VideoToolbox, ...) where available. FFmpeg falls back
+        to software decoding by itself when no accelerator can be used; sources
+        the FFmpeg backend cannot open are retried with the default backend.
+
+        Returns:
+            cv2.VideoCapture: Video capture for the source
+        """
+        cap = cv2.VideoCapture(
+            self.source,
+            cv2.CAP_FFMPEG,
+            [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+        )
+        if cap.isOpened():
+            return cap
+
+        cap.release()
+        return cv2.VideoCapture(self.source)
+
+    @staticmethod
+    def _is_live_source(source) -> bool:
+        """
+        Check whether a source is a camera or a live network stream.
+
+        Args:
+            source: Video source as passed to the constructor
+
+        Returns:
+            bool: True for camera indices and live stream URLs
+        """
+        if isinstance(source, int):
+            return True
+
+        return str(source).lower().startswith(LIVE_STREAM_SCHEMES)
+
+    def _open_hw_reader(self) -> None:
+        """
+        Switch decoding to a cv2.cudacodec reader, keeping CPU decoding if OpenCV
+        was built without CUDA video decoding support.
+        """
+        cudacodec = getattr(cv2, "cudacodec", None)
+        if cudacodec is None:
+            print("Warning: Hardware decoding not available, using CPU decoding")
+            return
+
+        try:
+            self.reader = cudacodec.createVideoReader(self.source)
+        except cv2.error as e:
+            print(f"Warning: Hardware decoding not available ({e}), using CPU decoding")
+            return
+
+        # Request BGR output where supported (default is BGRA)
+        color_format = getattr(cudacodec, "ColorFormat_BGR", None)
+        if color_format is not None:
+            self.reader.set(color_format)
+
+        # Frames are read from the GPU reader from now on
+        self.cap.release()
+        self.cap = None
+
+    def _allocate_buffers(self) -> None:
+        """
+        Allocate the frame ring, page-locking it when a CUDA device is present.
+        """
+        if self.width <= 0 or self.height <= 0:
+            return
+
+        self._buffers = [
+            np.empty((self.height, self.width, 3), dtype=np.uint8)
+            for _ in range(self.frame_buffers)
+        ]
+        self._buffer_index = 0
+
+        cuda = getattr(cv2, "cuda", None)
+        if cuda is None or cuda.getCudaEnabledDeviceCount() == 0:
+            return
+
+        registered = []
+        try:
+            for buffer in self._buffers:
+                cuda.registerPageLocked(buffer)
+                registered.append(buffer)
+        except cv2.error as e:
+            # Keep the buffers, just without page-locking
+            print(f"Warning: Could not page-lock frame buffers ({e})")
+            for buffer in registered:
+                cuda.unregisterPageLocked(buffer)
+            return
+
+        self._pinned = True
+
+    def _release_buffers(self) -> None:
+        """
+        Unregister page-locked frame buffers and drop the frame ring.
+        """
+        if self._pinned:
+            for buffer in self._buffers:
+                try:
+                    cv2.cuda.unregisterPageLocked(buffer)
+                except cv2.error:
+                    pass
+            self._pinned = False
+        self._buffers = []
+
     def close(self) -> None:
         """
         Close the video source.
         """
         if self.cap is not None:
             self.cap.release()
+        self.reader = None
+        self._gpu_frame = None
+        self._release_buffers()
 
     def get_frame(self) -> Tuple[bool, Optional[np.ndarray]]:
         """
         Get the next frame from the video.
 
+        Equivalent to grab followed by retrieve.
+
+        Returns:
+            Tuple[bool, Optional[np.ndarray]]: Success flag and frame (if successful)
+        """
+        if not self.grab():
+            return False, None
+
+        return self.retrieve()
+
+    def grab(self) -> bool:
+        """
+        Advance to the next frame without converting it to an image.
+
+        The frame is still decoded, but the color conversion (and for the GPU
+        reader, the download) is left to retrieve, so frames that are not
+        needed can be skipped cheaply.
+
+        Returns:
+            bool: True if a frame was grabbed, False at the end of the video
+        """
+        if self.reader is not None:
+            ret, gpu_frame = self.reader.nextFrame()
+            self._gpu_frame = gpu_frame if ret else None
+            return bool(ret)
+
+        if self.cap is None or not self.cap.isOpened():
+            return False
+
+        return bool(self.cap.grab())
+
+    def retrieve(self, out: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Convert the last grabbed frame to a BGR image.
+
+        Args:
+            out: Optional (height, width, 3) image to convert into, instead of
+                a new array or the frame ring
+
         Returns:
             Tuple[bool, Optional[np.ndarray]]: Success flag and frame (if successful)
         """
+        if self.reader is not None:
+            ret, frame = self._retrieve_hw_frame()
+            if ret and out is not None:
+                np.copyto(out, frame)
+                frame = out
+            return ret, frame
+
         if self.cap is None or not self.cap.isOpened():
             return False, None
 
-        ret, frame = self.cap.read()
+        if out is not None:
+            ret, frame = self.cap.retrieve(out)
+            if not ret:
+                return False, None
+
+            if frame is not out:
+                np.copyto(out, frame)
+
+            return True, out
+
+        if not self._buffers:
+            ret, frame = self.cap.retrieve()
+            if not ret:
+                return False, None
+
+            return True, frame
+
+        # Convert into the next frame of the ring
+        buffer = self._buffers[self._buffer_index]
+        ret, frame = self.cap.retrieve(buffer)
         if not ret:
             return False, None
 
+        if frame is buffer:
+            self._buffer_index = (self._buffer_index + 1) % len(self._buffers)
+
         return True, frame
 
-    def get_frames(self) -> Iterator[np.ndarray]:
+    def _retrieve_hw_frame(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Download the last frame grabbed from the GPU reader.
+
+        Returns:
+            Tuple[bool, Optional[np.ndarray]]: Success flag and frame (if successful)
+        """
+        if self._gpu_frame is None:
+            return False, None
+
+        frame = self._gpu_frame.download()
+        if frame.shape[2] == 4:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+
+        return True, frame
+
+    def seek(self, frame_index: int) -> bool:
+        """
+        Seek to the given frame so that the next get_frame call returns it.
+
+        Args:
+            frame_index: Index of the frame to seek to
+
+        Returns:
+            bool: True if the backend supports seeking and succeeded, False otherwise
+        """
+        if self.cap is None or not self.cap.isOpened():
+            return False
+
+        return bool(self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index))
+
+    def get_frames(self, interval: int = 1, prefetch: int = FRAME_PREFETCH) -> Iterator[np.ndarray]:
         """
         Generator that yields frames from the video.
 
+        Frames are decoded on a background thread, up to prefetch frames ahead
+        of the consumer, so that decoding overlaps with processing the frames.
+
+        Args:
+            interval: Yield every n-th frame; frames in between are skipped
+                without being converted to images
+            prefetch: Maximum number of decoded frames waiting to be yielded
+                (0 to decode each frame only when it is requested)
+
         Yields:
             np.ndarray: Video frame
         """
         if not self.open():
             return
 
+        # Frames in the queue, the one being yielded and the one being queued
+        # all have to stay intact while the decoder reuses frame buffers
+        if self.frame_buffers > 0:
+            prefetch = min(prefetch, self.frame_buffers - 2)
+
+        if prefetch <= 0:
+            try:
+                yield from self._read_frames(interval)
+            finally:
+                self.close()
+            return
+
+        frame_queue = queue.Queue(maxsize=prefetch)
+        stop_event = threading.Event()
+        decoder = threading.Thread(
+            target=self._decode_frames, args=(interval, frame_queue, stop_event), daemon=True
+        )
+        decoder.start()
+
         try:
             while True:
+                frame = frame_queue.get()
+                if frame is None:
+                    break
+                yield frame
+        finally:
+            # Stop the decoder, unblocking it if it waits on a full queue, and
+            # only release the capture once it no longer reads from it
+            stop_event.set()
+            while decoder.is_alive():
+                try:
+                    frame_queue.get_nowait()
+                except queue.Empty:
+                    decoder.join(0.01)
+            self.close()
+
+    def get_frames_array(self, max_frames: int, interval: int = 1) -> np.ndarray:
+        """
+        Read frames from the start of the video into a single array.
+
+        The frames are decoded straight into one preallocated array instead of
+        a separate array per frame. Always decodes with OpenCV.
+
+        Args:
+            max_frames: Maximum number of frames to read
+            interval: Read every n-th frame; frames in between are skipped
+                without being converted to images
+
+        Returns:
+            np.ndarray: Frames as a (num_frames, height, width, 3) array, with
+            fewer than max_frames frames if the video ends first
+        """
+        if not self.open():
+            return np.empty((0, self.height, self.width, 3), dtype=np.uint8)
+
+        interval = max(1, interval)
+        frames = np.empty((max_frames, self.height, self.width, 3), dtype=np.uint8)
+        count = 0
+        frame_index = 0
+        try:
+            while count < max_frames and self.grab():
+                if frame_index % interval == 0:
+                    ret, _ = self.retrieve(frames[count])
+                    if not ret:
+                        break
+                    count += 1
+                frame_index += 1
+        finally:
+            self.close()
+
+        return frames[:count]
+
+    def _read_frames(self, interval: int) -> Iterator[np.ndarray]:
+        """
+        Read every n-th frame until the video ends, skipping the others.
+
+        Args:
+            interval: Frame interval
+
+        Yields:
+            np.ndarray: Video frame
+        """
+        interval = max(1, interval)
+        if self.backend == "pyav" and av is not None and not isinstance(self.source, int):
+            yield from self._read_av_frames(interval)
+            return
+
+        frame_index = 0
+        while True:
+            if frame_index % interval:
+                if not self.grab():
+                    break
+            else:
                 ret, frame = self.get_frame()
                 if not ret:
                     break
                 yield frame
+            frame_index += 1
+
+    def _read_av_frames(self, interval: int) -> Iterator[np.ndarray]:
+        """
+        Read every n-th frame with PyAV, converting only those to images.
+
+        Args:
+            interval: Frame interval
+
+        Yields:
+            np.ndarray: Video frame
+        """
+        try:
+            container = av.open(str(self.source))
+        except Exception as e:
+            print(f"Error opening video source with PyAV: {e}")
+            return
+
+        try:
+            stream = container.streams.video[0]
+
+            # Let FFmpeg decode with frame and slice threads across all cores
+            stream.thread_type = "AUTO"
+
+            for frame_index, frame in enumerate(container.decode(stream)):
+                if frame_index % interval == 0:
+                    yield frame.to_ndarray(format="bgr24")
         finally:
-            self.close()
+            container.close()
+
+    def _decode_frames(
+        self, interval: int, frame_queue: queue.Queue, stop_event: threading.Event
+    ) -> None:
+        """
+        Read frames into the queue until the video ends or decoding is stopped.
+
+        Runs on the decoder thread of get_frames. A None sentinel is queued when
+        decoding ends.
+        """
+        try:
+            for frame in self._read_frames(interval):
+                if stop_event.is_set():
+                    break
+                frame_queue.put(frame)
+        finally:
+            frame_queue.put(None)
 
     def get_video_info(self) -> dict:
         """
@@ -128,9 +542,42 @@ class VideoInput:
         if path.suffix.lower() not in valid_extensions:
             return False
 
-        # Try opening the file
+        # Accept files that start with a known container signature
+        try:
+            with path.open("rb") as f:
+                header = f.read(16)
+        except OSError:
+            return False
+
+        if VideoInput._has_container_signature(header):
+            return True
+
+        # Fall back to opening the file, e.g. for QuickTime files that start
+        # with an atom other than ftyp
         cap = cv2.VideoCapture(str(path))
         is_valid = cap.isOpened()
         cap.release()
 
         return is_valid
+
+    @staticmethod
+    def _has_container_signature(header: bytes) -> bool:
+        """
+        Check if a file header starts like an MP4/MOV, AVI or Matroska/WebM file.
+
+        Args:
+            header: First 16 bytes of the file
+
+        Returns:
+            bool: True if the header matches a known container, False otherwise
+        """
+        # MP4 and MOV: size of the first box, then its type
+        if header[4:8] == b"ftyp":
+            return True
+
+        # AVI: RIFF chunk of form type "AVI "
+        if header[:4] == b"RIFF" and header[8:12] == b"AVI ":
+            return True
+
+        # Matroska and WebM: EBML magic number
+        return header[:4] == b"\x1aE\xdf\xa3"
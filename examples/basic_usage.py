@@ -5,7 +5,9 @@ Basic usage example for the Chess Video Analyzer.
 import argparse
 import cv2
 import os
+import queue
 import sys
+import threading
 from pathlib import Path
 
 import chess
@@ -20,12 +22,107 @@ from chess_video_analyzer.moves.tracker import MoveTracker
 from chess_video_analyzer.notation.generator import NotationGenerator
 from chess_video_analyzer.utils.visualization import Visualizer
 
+# Maximum number of frames waiting between pipeline stages
+QUEUE_SIZE = 4
+
+# Smallest frame interval for which sampled frames are reached by seeking.
+# A seek restarts decoding at the keyframe before the target, so it only pays
+# off when samples are further apart than keyframes typically are.
+SEEK_MIN_INTERVAL = 60
+
+# Consecutive invalid positions after which the board is searched for again
+# instead of reusing the last detected board
+MAX_INVALID_POSITIONS = 3
+
+WINDOW_NAME = "Chess Video Analyzer Example"
+
+
+def put_item(item_queue: queue.Queue, item, stop_event: threading.Event) -> bool:
+    """Put an item on a queue, giving up once the pipeline is stopped."""
+    while not stop_event.is_set():
+        try:
+            item_queue.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def put_latest(item_queue: queue.Queue, item) -> None:
+    """Put an item on a queue, dropping the oldest waiting items if it is full."""
+    while True:
+        try:
+            item_queue.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                item_queue.get_nowait()
+            except queue.Empty:
+                pass
+
+
+def get_item(item_queue: queue.Queue, stop_event: threading.Event):
+    """Get an item from a queue, returning None once the pipeline is stopped."""
+    while not stop_event.is_set():
+        try:
+            return item_queue.get(timeout=0.1)
+        except queue.Empty:
+            pass
+    return None
+
+
+def decode_frames(
+    video_input: VideoInput,
+    frame_interval: int,
+    read_queue: queue.Queue,
+    stop_event: threading.Event,
+) -> None:
+    """
+    Decoder stage: queue every sampled frame with its index.
+
+    Frames in between are not decoded when the interval is long enough to
+    seek past them, and are skipped without being converted otherwise. A None
+    sentinel is queued when decoding ends.
+    """
+    use_seek = frame_interval >= SEEK_MIN_INTERVAL
+    frame_count = 0
+    try:
+        while not stop_event.is_set():
+            ret, frame = video_input.get_frame()
+            if not ret:
+                break
+                
+            if not put_item(read_queue, (frame_count, frame), stop_event):
+                break
+                
+            # Advance to the next sampled frame
+            next_frame = frame_count + frame_interval
+            if use_seek:
+                if video_input.seek(next_frame):
+                    frame_count = next_frame
+                    continue
+                use_seek = False  # The backend cannot seek this source
+                
+            frame_count += 1
+            while frame_count < next_frame and video_input.grab():
+                frame_count += 1
+                
+            if frame_count < next_frame:
+                break
+    finally:
+        put_item(read_queue, None, stop_event)
+
 
 def main():
     """Main function."""
     # Parse arguments
     parser = argparse.ArgumentParser(description="Chess Video Analyzer Example")
     parser.add_argument("video_path", help="Path to the video file")
+    parser.add_argument(
+        "--no-wait",
+        action="store_true",
+        help="Run through the video without waiting for a key press on each frame",
+    )
     args = parser.parse_args()
     
     # Check if the video file exists
@@ -33,10 +130,20 @@ def main():
         print(f"Error: Video file not found: {args.video_path}")
         sys.exit(1)
         
+    # Decoding and analysis run on threads of their own, so OpenCV's internal
+    # thread pool gets half the cores to keep the stages from oversubscribing
+    # the CPU
+    cv2.setNumThreads(max(1, (os.cpu_count() or 2) // 2))
+        
     # Initialize components
-    video_input = VideoInput(args.video_path)
+    # Decode into a ring with room for every frame the pipeline can hold: the
+    # queued ones, the one being analyzed and the one being decoded. Low latency
+    # only takes effect if the source is a camera or stream.
+    video_input = VideoInput(args.video_path, frame_buffers=QUEUE_SIZE + 2, low_latency=True)
     frame_extractor = FrameExtractor(target_fps=1.0)  # Process 1 frame per second
-    board_detector = BoardDetector()
+    # Full-frame board searches already run on a frame halved pyramid_levels
+    # times, with the corners refined at full resolution
+    board_detector = BoardDetector(pyramid_levels=1)
     board_normalizer = BoardNormalizer()
     position_extractor = PositionExtractor()
     position_validator = PositionValidator()
@@ -56,107 +163,205 @@ def main():
     frame_extractor.set_frame_interval(video_input.fps)
     
     # Process frames
-    frame_count = 0
     detected_positions = []
     
-    # Create a window for visualization
-    cv2.namedWindow("Chess Video Analyzer Example", cv2.WINDOW_NORMAL)
-    cv2.resizeWindow("Chess Video Analyzer Example", 1200, 600)
-    
-    print("\nPress 'q' to quit, any other key to continue to the next frame")
-    
-    while True:
-        # Get frame
-        ret, frame = video_input.get_frame()
-        if not ret:
-            break
-            
-        # Process every nth frame based on frame interval
-        if frame_count % frame_extractor.frame_interval == 0:
-            print(f"\nProcessing frame {frame_count} ({frame_count / video_input.fps:.2f} seconds)")
-            
-            # Process frame
-            processed_frame = frame_extractor.process_frame(frame)
-            
-            # Detect board
-            board_contour = board_detector.detect_board(processed_frame)
+    def analyze_frames(
+        read_queue: queue.Queue, display_queue: queue.Queue, stop_event: threading.Event
+    ) -> None:
+        """
+        Compute stage: analyze sampled frames and queue images to display.
+
+        A None sentinel is queued when analysis ends. Without waiting for key
+        presses, images replace ones still waiting to be displayed, so
+        analysis never waits for the display.
+        """
+        def show(vis_img) -> bool:
+            """Queue an image for display, returning False once stopped."""
+            if args.no_wait:
+                put_latest(display_queue, vis_img)
+                return True
+            return put_item(display_queue, vis_img, stop_event)
             
-            if board_contour is not None:
+        # Working images reused from one frame to the next. Composed images
+        # rotate through a ring with room for the queued ones, the one on
+        # screen and the one being composed.
+        board_buf = None
+        gray_buf = None
+        normalized_buf = None
+        board_vis_buf = None
+        vis_bufs = [None] * (QUEUE_SIZE + 2)
+        vis_index = 0
+        invalid_count = 0
+        last_position = None  # (board_fen, turn) of the last extracted position
+        last_validation = None
+        try:
+            while True:
+                item = get_item(read_queue, stop_event)
+                if item is None:
+                    break
+                frame_count, frame = item
+                
+                print(f"\nProcessing frame {frame_count} ({frame_count / video_input.fps:.2f} seconds)")
+                
+                # Process frame
+                processed_frame = frame_extractor.process_frame(frame)
+                
+                # Detect board
+                board_contour = board_detector.detect_board(processed_frame)
+                
+                if board_contour is None:
+                    print("No chess board detected")
+                    # Copy the frame, as its buffer is reused by the decoder
+                    if not show(processed_frame.copy()):
+                        break
+                    continue
+                    
                 print("Chess board detected")
                 
                 # Draw board contour
                 contour_img = board_detector.draw_board_contour(processed_frame, board_contour)
                 
                 # Extract and normalize board
-                board_img = board_detector.extract_board(processed_frame, board_contour)
+                board_img = board_detector.extract_board(
+                    processed_frame, board_contour, dst=board_buf
+                )
                 
-                if board_img is not None:
-                    # Normalize board
-                    normalized_board = board_normalizer.normalize_board(board_img)
-                    
-                    # Create grid
-                    grid = board_normalizer.create_grid(normalized_board)
-                    
-                    # Extract position
-                    board = position_extractor.extract_position(normalized_board, grid)
+                if board_img is None:
+                    print("Could not extract board image")
+                    continue
+                board_buf = board_img
                     
-                    # Validate position
+                # Normalize board in grayscale, as piece detection only looks at
+                # luminance. Converting before resizing leaves a third of the
+                # data to resize.
+                gray_board = cv2.cvtColor(board_img, cv2.COLOR_BGR2GRAY, dst=gray_buf)
+                gray_buf = gray_board
+                normalized_board = board_normalizer.normalize_board(gray_board, dst=normalized_buf)
+                normalized_buf = normalized_board
+                
+                # Create grid
+                grid = board_normalizer.create_grid(normalized_board)
+                
+                # Extract position
+                board = position_extractor.extract_position(normalized_board, grid)
+                
+                # Frames of an unchanged position, e.g. while a player thinks,
+                # repeat the last validation result and cannot contain a move
+                position = (board.board_fen(), board.turn)
+                repeated = position == last_position
+                
+                # Validate position
+                if repeated:
+                    is_valid, issues = last_validation
+                else:
                     is_valid, issues = position_validator.validate_position(board)
-                    
-                    if is_valid:
-                        print("Valid chess position detected")
-                        
-                        # Track move
-                        if not detected_positions:
-                            move_tracker.set_initial_position(board)
-                            print("Initial position set")
-                        else:
-                            move = move_tracker.track_move(board)
-                            
-                            if move:
-                                notation_generator.add_move(move)
-                                print(f"Detected move: {board.san(move)}")
-                                
-                        detected_positions.append(board)
-                        
-                        # Draw board visualization
-                        board_vis = visualizer.draw_board(board)
-                        board_vis = visualizer.draw_coordinates(board_vis)
-                        
-                        # Add FEN overlay
-                        fen = board.fen().split(" ")[0]  # Just the piece placement part
-                        board_vis = visualizer.add_text_overlay(board_vis, fen)
+                    last_position = position
+                    last_validation = (is_valid, issues)
+                
+                if not is_valid:
+                    print("Invalid chess position detected:")
+                    for issue in issues:
+                        print(f"  - {issue}")
                         
-                        # Create side-by-side visualization
-                        vis_img = visualizer.create_side_by_side(
-                            contour_img,
-                            board_vis,
-                            labels=("Detected Board", "Extracted Position")
-                        )
+                    # The reused board outline may have gone stale
+                    invalid_count += 1
+                    if invalid_count >= MAX_INVALID_POSITIONS:
+                        board_detector.reset()
+                        invalid_count = 0
+                    continue
+                invalid_count = 0
+                    
+                print("Valid chess position detected")
+                
+                # Track move
+                if not detected_positions:
+                    move_tracker.set_initial_position(board)
+                    print("Initial position set")
+                elif not repeated:
+                    move = move_tracker.track_move(board)
+                    
+                    if move:
+                        notation_generator.add_move(move)
                         
-                        # Show visualization
-                        cv2.imshow("Chess Video Analyzer Example", vis_img)
+                        # Print the move in SAN with its move number as soon as
+                        # it is detected
+                        move_index = len(notation_generator.moves) - 1
+                        for san in notation_generator.iter_san(move_index):
+                            dots = "." if move_index % 2 == 0 else "..."
+                            print(f"Detected move: {move_index // 2 + 1}{dots} {san}")
                         
-                        # Wait for key press
-                        key = cv2.waitKey(0)
-                        if key == ord('q'):
-                            break
-                    else:
-                        print("Invalid chess position detected:")
-                        for issue in issues:
-                            print(f"  - {issue}")
-                else:
-                    print("Could not extract board image")
-            else:
-                print("No chess board detected")
-                cv2.imshow("Chess Video Analyzer Example", processed_frame)
+                detected_positions.append(board)
+                
+                # Draw board visualization
+                board_vis = visualizer.draw_board(board, dst=board_vis_buf)
+                board_vis_buf = board_vis
+                board_vis = visualizer.draw_coordinates(board_vis, inplace=True)
+                
+                # Add FEN overlay
+                fen = board.fen().split(" ")[0]  # Just the piece placement part
+                board_vis = visualizer.add_text_overlay(board_vis, fen, inplace=True)
                 
-                # Wait for key press
-                key = cv2.waitKey(0)
-                if key == ord('q'):
+                # Create side-by-side visualization
+                vis_img = visualizer.create_side_by_side(
+                    contour_img,
+                    board_vis,
+                    labels=("Detected Board", "Extracted Position"),
+                    dst=vis_bufs[vis_index]
+                )
+                vis_bufs[vis_index] = vis_img
+                vis_index = (vis_index + 1) % len(vis_bufs)
+                
+                if not show(vis_img):
                     break
-                    
-        frame_count += 1
+        finally:
+            show(None)
+            
+    # Create a window for visualization
+    cv2.namedWindow(WINDOW_NAME, cv2.WINDOW_NORMAL)
+    cv2.resizeWindow(WINDOW_NAME, 1200, 600)
+    
+    if args.no_wait:
+        print("\nPress 'q' to quit")
+    else:
+        print("\nPress 'q' to quit, any other key to continue to the next frame")
+    
+    # Decode and analyze on background threads, so that both run ahead while
+    # a frame is on screen. The window is driven from the main thread, since
+    # GUI backends expect that.
+    read_queue = queue.Queue(maxsize=QUEUE_SIZE)
+    display_queue = queue.Queue(maxsize=1 if args.no_wait else QUEUE_SIZE)
+    stop_event = threading.Event()
+    stages = [
+        threading.Thread(
+            target=decode_frames,
+            args=(video_input, frame_extractor.frame_interval, read_queue, stop_event),
+            daemon=True,
+        ),
+        threading.Thread(
+            target=analyze_frames, args=(read_queue, display_queue, stop_event), daemon=True
+        ),
+    ]
+    for stage in stages:
+        stage.start()
+        
+    # Display stage
+    while True:
+        vis_img = display_queue.get()
+        if vis_img is None:
+            break
+            
+        # Show visualization
+        cv2.imshow(WINDOW_NAME, vis_img)
+        
+        # Wait for key press, or just let the window refresh
+        key = cv2.waitKey(1 if args.no_wait else 0)
+        if key == ord('q'):
+            break
+            
+    # Stop the other stages if the display stage quit early
+    stop_event.set()
+    for stage in stages:
+        stage.join()
         
     # Close video
     video_input.close()
@@ -0,0 +1,40 @@
+"""
+Tests for the BoardNormalizer class.
+"""
+
+import cv2
+import numpy as np
+
+from chess_video_analyzer.board.normalizer import ROTATION_CACHE_SIZE, BoardNormalizer
+
+
+def test_rotate_board_cache_bounded():
+    """Test that rotation matrices for many angles and sizes are not all kept."""
+    normalizer = BoardNormalizer()
+    for size in (40, 41, 42):
+        board_img = np.zeros((size, size, 3), dtype=np.uint8)
+        for i in range(20):
+            normalizer.rotate_board(board_img, i * 0.3)
+
+    assert len(normalizer._rot_cache) == ROTATION_CACHE_SIZE
+
+
+def test_enhance_normalized_buffers():
+    """Test the fused normalize/enhance pass and its buffer reuse."""
+    rng = np.random.default_rng(0)
+    board_img = rng.integers(0, 256, (120, 120, 3), dtype=np.uint8)
+    normalizer = BoardNormalizer(target_size=80)
+
+    # Same enhancement as enhance_board, on a board resized in grayscale
+    gray = cv2.resize(
+        cv2.cvtColor(board_img, cv2.COLOR_BGR2GRAY), (80, 80), interpolation=cv2.INTER_AREA
+    )
+    expected = normalizer.enhance_board(gray)
+    enhanced = normalizer.enhance_normalized(board_img)
+    assert enhanced.shape == (80, 80)
+    assert np.array_equal(enhanced, expected)
+
+    # The output buffer is reused, and can be passed back in
+    again = normalizer.enhance_normalized(enhanced)
+    assert again is enhanced
+    assert np.array_equal(again, normalizer.enhance_board(expected))
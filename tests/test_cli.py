@@ -0,0 +1,39 @@
+"""
+Tests for the command-line interface.
+"""
+
+import queue
+import threading
+
+import numpy as np
+
+from chess_video_analyzer.board.detector import BoardDetector
+from chess_video_analyzer.cli.main import _decode_frames
+from chess_video_analyzer.video.frame import FrameExtractor
+
+
+class FailingVideo:
+    """Video input that returns a few blank frames and then fails."""
+
+    def __init__(self, frames):
+        self.frames = frames
+
+    def get_frame(self):
+        if self.frames == 0:
+            raise IOError("read failed")
+        self.frames -= 1
+        return True, np.zeros((48, 64, 3), dtype=np.uint8)
+
+
+def test_decode_frames_queues_error():
+    """Test that a decoding error is queued ahead of the end sentinel."""
+    frame_queue = queue.Queue()
+    _decode_frames(
+        FailingVideo(2), FrameExtractor(), BoardDetector(), 1, 0, None,
+        frame_queue, threading.Event(),
+    )
+
+    items = [frame_queue.get() for _ in range(frame_queue.qsize())]
+    assert [item[0] for item in items[:2]] == [0, 1]
+    assert isinstance(items[2], IOError)
+    assert items[3] is None
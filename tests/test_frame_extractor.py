@@ -0,0 +1,80 @@
+"""
+Tests for the FrameExtractor class.
+"""
+
+import numpy as np
+import pytest
+
+from chess_video_analyzer.video.frame import FrameExtractor
+
+
+def make_frames(count, width=64, height=48):
+    """Create frames filled with their index."""
+    return [np.full((height, width, 3), i, dtype=np.uint8) for i in range(count)]
+
+
+def test_extract_frames_interval():
+    """Test extracting every n-th frame, with and without resizing."""
+    frames = make_frames(10)
+
+    extractor = FrameExtractor(target_fps=10)
+    extractor.set_frame_interval(30)
+    assert extractor.frame_interval == 3
+
+    extracted = extractor.extract_frames(frames)
+    assert [int(frame[0, 0, 0]) for frame in extracted] == [0, 3, 6, 9]
+
+    extractor = FrameExtractor(target_fps=10, resize_dim=(32, 24))
+    extractor.set_frame_interval(30)
+    extracted = extractor.extract_frames(frames)
+    assert [frame.shape for frame in extracted] == [(24, 32, 3)] * 4
+    assert [int(frame[0, 0, 0]) for frame in extracted] == [0, 3, 6, 9]
+
+
+def test_extract_frames_batch():
+    """Test that batch extraction matches extracting frames one by one."""
+    frames = make_frames(10)
+
+    extractor = FrameExtractor(target_fps=10, resize_dim=(32, 24))
+    extractor.set_frame_interval(30)
+    batch = extractor.extract_frames_batch(frames)
+
+    assert batch.shape == (4, 24, 32, 3)
+    assert np.array_equal(batch, np.stack(extractor.extract_frames(frames)))
+
+    with pytest.raises(ValueError):
+        extractor.extract_frames_batch([])
+
+
+def test_process_batch():
+    """Test that batch processing matches processing frames one by one."""
+    rng = np.random.default_rng(0)
+    frames = rng.integers(0, 256, (5, 48, 64, 3), dtype=np.uint8)
+
+    extractor = FrameExtractor(resize_dim=(32, 24))
+    batch = extractor.process_batch(frames)
+    assert batch.shape == (5, 24, 32, 3)
+    assert np.array_equal(batch, np.stack([extractor.process_frame(f) for f in frames]))
+
+    # The output array is reused
+    assert extractor.process_batch(frames, out=batch) is batch
+
+    # Without resizing, frames are returned unchanged
+    assert FrameExtractor().process_batch(frames) is frames
+
+
+def test_extract_key_frames():
+    """Test selecting evenly spaced key frames as a list or an array."""
+    frames = make_frames(20)
+
+    key_frames = FrameExtractor.extract_key_frames(frames, max_frames=5)
+    assert [int(frame[0, 0, 0]) for frame in key_frames] == [0, 4, 9, 14, 19]
+
+    key_array = FrameExtractor.extract_key_frames(frames, max_frames=5, as_array=True)
+    assert key_array.shape == (5, 48, 64, 3)
+    assert np.array_equal(key_array, np.stack(key_frames))
+
+    assert FrameExtractor.extract_key_frames(frames[:3], as_array=True).shape == (3, 48, 64, 3)
+    assert FrameExtractor.extract_key_frames([]) == []
+    with pytest.raises(ValueError):
+        FrameExtractor.extract_key_frames([], as_array=True)
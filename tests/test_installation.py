@@ -5,6 +5,20 @@ Test script to verify that the installation works correctly.
 import sys
 import importlib
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from packaging.version import InvalidVersion, Version
+
+
+def _try_import(module_name: str) -> Tuple[str, Optional[ImportError]]:
+    """Import a module, returning its name and the import error if any."""
+    try:
+        importlib.import_module(module_name)
+    except ImportError as e:
+        return module_name, e
+    return module_name, None
+
 
 def test_import_modules():
     """Test importing all required modules."""
@@ -27,12 +41,16 @@ def test_import_modules():
     
     failed_imports = []
     
-    for module_name in modules:
-        try:
-            importlib.import_module(module_name)
+    # Import on several threads so that finding and reading the modules
+    # overlaps; results are reported in list order
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(_try_import, modules))
+        
+    for module_name, error in results:
+        if error is None:
             print(f"✓ Successfully imported {module_name}")
-        except ImportError as e:
-            print(f"✗ Failed to import {module_name}: {e}")
+        else:
+            print(f"✗ Failed to import {module_name}: {error}")
             failed_imports.append(module_name)
             
     if failed_imports:
@@ -46,55 +64,41 @@ def test_import_modules():
         return True
 
 
-def test_opencv_version():
-    """Test OpenCV version."""
-    import cv2
-    version = cv2.__version__
-    print(f"OpenCV version: {version}")
+def _check_version(name: str, version: str, minimum: str) -> bool:
+    """Check a dependency version against the minimum recommended version."""
+    print(f"{name} version: {version}")
     
-    # Parse version string
-    major, minor, patch = map(int, version.split('.')[:3])
+    # Parse version string, allowing suffixes such as 1.26.0rc1 or 4.9.0.80
+    try:
+        compatible = Version(version) >= Version(minimum)
+    except InvalidVersion:
+        print(f"Warning: Could not parse {name} version {version!r}.")
+        return False
     
-    if major < 4:
-        print("Warning: OpenCV version 4.x or higher is recommended.")
+    if not compatible:
+        print(f"Warning: {name} version {minimum} or higher is recommended.")
         return False
     else:
-        print("OpenCV version is compatible.")
+        print(f"{name} version is compatible.")
         return True
 
 
+def test_opencv_version():
+    """Test OpenCV version."""
+    import cv2
+    return _check_version("OpenCV", cv2.__version__, "4.0")
+
+
 def test_python_chess_version():
     """Test python-chess version."""
     import chess
-    version = chess.__version__
-    print(f"python-chess version: {version}")
-    
-    # Parse version string
-    major, minor, patch = map(int, version.split('.')[:3])
-    
-    if major < 1:
-        print("Warning: python-chess version 1.x or higher is recommended.")
-        return False
-    else:
-        print("python-chess version is compatible.")
-        return True
+    return _check_version("python-chess", chess.__version__, "1.0")
 
 
 def test_numpy_version():
     """Test NumPy version."""
     import numpy
-    version = numpy.__version__
-    print(f"NumPy version: {version}")
-    
-    # Parse version string
-    major, minor, patch = map(int, version.split('.')[:3])
-    
-    if major < 1 or (major == 1 and minor < 20):
-        print("Warning: NumPy version 1.20.0 or higher is recommended.")
-        return False
-    else:
-        print("NumPy version is compatible.")
-        return True
+    return _check_version("NumPy", numpy.__version__, "1.20.0")
 
 
 def main():
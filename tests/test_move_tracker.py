@@ -0,0 +1,53 @@
+"""
+Tests for the MoveTracker class.
+"""
+
+import chess
+import pytest
+
+from chess_video_analyzer.moves.tracker import MoveTracker
+
+
+def board_after(*moves):
+    """Create a board with the given UCI moves played, without a move stack."""
+    board = chess.Board()
+    for move in moves:
+        board.push_uci(move)
+    return chess.Board(board.fen())
+
+
+def test_track_move_detects_moves():
+    """Test detecting simple moves, captures and castling from positions."""
+    tracker = MoveTracker()
+    tracker.set_initial_position(chess.Board())
+
+    game = ["e2e4", "e7e5", "g1f3", "b8c6", "f1b5", "a7a6", "b5c6", "d7c6", "e1g1"]
+    for i, move in enumerate(game):
+        # Repeated frames of the same position do not produce a move
+        assert tracker.track_move(board_after(*game[:i])) is None
+        assert tracker.track_move(board_after(*game[:i + 1])) == chess.Move.from_uci(move)
+
+    assert tracker.get_moves() == tuple(chess.Move.from_uci(move) for move in game)
+    assert tracker.get_pgn() == "1. e4 e5 2. Nf3 Nc6 3. Bb5 a6 4. Bxc6 dxc6 5. O-O"
+
+
+def test_track_move_incremental():
+    """Test tracking known moves without modifying the caller's board."""
+    tracker = MoveTracker()
+    board = chess.Board()
+    tracker.track_move(board)
+
+    tracker.track_move_incremental(chess.Move.from_uci("e2e4"))
+    tracker.track_move_incremental(chess.Move.from_uci("e7e5"))
+
+    assert board.fen() == chess.STARTING_FEN
+    assert tracker.get_fen() == board_after("e2e4", "e7e5").fen()
+
+    # Detection continues from the incrementally updated position
+    assert tracker.track_move(board_after("e2e4", "e7e5", "g1f3")) == chess.Move.from_uci("g1f3")
+    assert tracker.get_pgn() == "1. e4 e5 2. Nf3"
+    assert tracker.moves is tracker.get_moves()
+
+    # The moves can only be changed by tracking positions
+    with pytest.raises(AttributeError):
+        tracker.moves = []
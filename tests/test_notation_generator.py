@@ -0,0 +1,41 @@
+"""
+Tests for the NotationGenerator class.
+"""
+
+import chess
+import pytest
+
+from chess_video_analyzer.notation.generator import NotationGenerator
+
+
+def test_iter_san_streams_new_moves():
+    """Test iterating over SAN moves from a given move as moves are added."""
+    generator = NotationGenerator()
+    moves = ["e2e4", "e7e5", "g1f3"]
+    streamed = []
+
+    for i, move in enumerate(moves):
+        generator.add_move(chess.Move.from_uci(move))
+        streamed.extend(generator.iter_san(i))
+
+    assert streamed == ["e4", "e5", "Nf3"]
+    assert list(generator.iter_san()) == generator.get_move_list()
+    assert generator.get_formatted_move_list() == "1. e4 e5 2. Nf3"
+
+
+def test_set_moves_replaces_cached_notation():
+    """Test that replacing the moves is reflected in all notation."""
+    generator = NotationGenerator()
+    generator.set_moves([chess.Move.from_uci("e2e4")])
+    assert generator.get_move_list() == ["e4"]
+    assert "1. e4" in generator.get_pgn()
+
+    generator.set_moves([chess.Move.from_uci("d2d4")])
+    assert generator.moves == (chess.Move.from_uci("d2d4"),)
+    assert generator.get_move_list() == ["d4"]
+    assert generator.get_fen() == "rnbqkbnr/pppppppp/8/8/3P4/8/PPP1PPPP/RNBQKBNR b KQkq - 0 1"
+    assert "1. d4" in generator.get_pgn()
+
+    # The moves can only be changed through add_move and set_moves
+    with pytest.raises(AttributeError):
+        generator.moves = [chess.Move.from_uci("e2e4")]
@@ -0,0 +1,50 @@
+"""
+Tests for the PositionValidator class.
+"""
+
+import chess
+
+from chess_video_analyzer.position.validator import VALIDATION_CACHE_SIZE, PositionValidator
+
+
+def test_validate_position():
+    """Test validating legal and illegal positions."""
+    validator = PositionValidator()
+
+    assert validator.validate_position(chess.Board()) == (True, [])
+    assert validator.is_reasonable_position(chess.Board()) is True
+
+    # Missing black king
+    board = chess.Board("8/8/8/8/8/8/8/4K3 w - - 0 1")
+    assert validator.validate_position(board) == (False, ["Invalid black king count: 0"])
+    assert validator.is_reasonable_position(board) is False
+
+    # Pawn on the last rank and the side not to move in check
+    board = chess.Board("P3k3/8/8/8/8/8/8/4K3 w - - 0 1")
+    assert validator.validate_position(board) == (False, ["Pawn on last rank at a8"])
+    board = chess.Board("4k3/8/8/8/8/8/8/4R1K1 w - - 0 1")
+    assert validator.validate_position(board) == (False, ["The side not to move is in check"])
+
+
+def test_validate_position_cache():
+    """Test that cached results are reused without sharing the issues list."""
+    validator = PositionValidator()
+    board = chess.Board("8/8/8/8/8/8/8/4K3 w - - 0 1")
+
+    is_valid, issues = validator.validate_position(board)
+    issues.append("modified by caller")
+    assert validator.validate_position(board.copy()) == (False, ["Invalid black king count: 0"])
+
+    # The side to move is part of the key, since it decides the check state
+    board = chess.Board("4k3/8/8/8/8/8/8/4R1K1 b - - 0 1")
+    assert validator.validate_position(board) == (True, [])
+    board.turn = chess.WHITE
+    assert validator.validate_position(board) == (False, ["The side not to move is in check"])
+
+    # The cache is bounded
+    for i in range(VALIDATION_CACHE_SIZE + 10):
+        board = chess.Board(None)
+        board.set_piece_at(i % 64, chess.Piece.from_symbol("K"))
+        board.set_piece_at((i // 64 + 1 + i) % 64, chess.Piece.from_symbol("k"))
+        validator.validate_position(board)
+    assert len(validator._validation_cache) == VALIDATION_CACHE_SIZE
@@ -12,9 +12,13 @@ from pathlib import Path
 from chess_video_analyzer.video.input import VideoInput
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_video_path():
-    """Create a temporary sample video file for testing."""
+    """
+    Create a temporary sample video file for testing.
+
+    The video is encoded once per test session; tests only read it.
+    """
     with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as f:
         temp_path = f.name
         
@@ -26,9 +30,11 @@ def sample_video_path():
     fourcc = cv2.VideoWriter_fourcc(*'mp4v')
     out = cv2.VideoWriter(temp_path, fourcc, fps, (width, height))
     
-    # Create frames with frame numbers
+    # Create frames with frame numbers, which keep the frames distinct for
+    # tests that compare frame contents
+    frame = np.empty((height, width, 3), dtype=np.uint8)
     for i in range(int(fps * duration)):
-        frame = np.zeros((height, width, 3), dtype=np.uint8)
+        frame.fill(0)
         # Add frame number text
         cv2.putText(
             frame,
@@ -85,6 +91,27 @@ def test_video_input_get_frame(sample_video_path):
     video_input.close()
 
 
+def test_video_input_seek(sample_video_path):
+    """Test seeking to a frame."""
+    video_input = VideoInput(sample_video_path)
+    assert video_input.seek(10) is False  # Not opened yet
+    
+    video_input.open()
+    assert video_input.seek(10) is True
+    
+    # Read the remaining frames
+    frame_count = 0
+    while True:
+        ret, frame = video_input.get_frame()
+        if not ret:
+            break
+        frame_count += 1
+        
+    assert frame_count == 20
+    
+    video_input.close()
+
+
 def test_video_input_get_frames(sample_video_path):
     """Test the frame generator."""
     video_input = VideoInput(sample_video_path)
@@ -94,6 +121,18 @@ def test_video_input_get_frames(sample_video_path):
     assert all(frame.shape == (480, 640, 3) for frame in frames)
 
 
+def test_video_input_hw_decode_fallback(sample_video_path):
+    """Test that hardware decoding falls back to CPU decoding when unavailable."""
+    video_input = VideoInput(sample_video_path, hw_decode=True)
+    assert video_input.open() is True
+    
+    ret, frame = video_input.get_frame()
+    assert ret is True
+    assert frame.shape == (480, 640, 3)
+    
+    video_input.close()
+
+
 def test_video_input_invalid_file():
     """Test handling of invalid video files."""
     video_input = VideoInput("nonexistent_file.mp4")
@@ -113,6 +152,15 @@ def test_video_input_is_valid_video_file(sample_video_path):
     assert VideoInput.is_valid_video_file(temp_path) is False
     
     os.unlink(temp_path)
+    
+    # Create a non-video file with a video extension
+    with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as f:
+        f.write(b"This is not a video file")
+        temp_path = f.name
+        
+    assert VideoInput.is_valid_video_file(temp_path) is False
+    
+    os.unlink(temp_path)
 
 
 def test_video_input_get_video_info(sample_video_path):
@@ -128,3 +176,118 @@ def test_video_input_get_video_info(sample_video_path):
     assert info["frame_count"] == 30
     
     video_input.close()
+
+
+def test_video_input_get_frames_early_exit(sample_video_path):
+    """Test stopping the frame generator before the end of the video."""
+    video_input = VideoInput(sample_video_path)
+    
+    frames = video_input.get_frames(prefetch=2)
+    first = [next(frames) for _ in range(5)]
+    frames.close()
+    
+    assert len(first) == 5
+    assert video_input.cap is None or not video_input.cap.isOpened()
+    
+    # Frames match those decoded without prefetching
+    expected = list(VideoInput(sample_video_path).get_frames(prefetch=0))
+    assert len(expected) == 30
+    assert all(np.array_equal(a, b) for a, b in zip(first, expected))
+
+
+def test_video_input_get_frames_interval(sample_video_path):
+    """Test yielding every n-th frame."""
+    all_frames = list(VideoInput(sample_video_path).get_frames(prefetch=0))
+    
+    for prefetch in (0, 4):
+        frames = list(VideoInput(sample_video_path).get_frames(interval=7, prefetch=prefetch))
+        assert len(frames) == 5
+        assert all(np.array_equal(a, b) for a, b in zip(frames, all_frames[::7]))
+
+
+def test_video_input_frame_buffers(sample_video_path):
+    """Test decoding into a ring of preallocated frames."""
+    expected = list(VideoInput(sample_video_path).get_frames(prefetch=0))
+    
+    video_input = VideoInput(sample_video_path, frame_buffers=3)
+    video_input.open()
+    
+    frames = []
+    for i in range(6):
+        ret, frame = video_input.get_frame()
+        assert ret is True
+        assert np.array_equal(frame, expected[i])
+        frames.append(frame)
+        
+    # Frames are reused after a full cycle of the ring
+    assert frames[3] is frames[0]
+    assert frames[1] is not frames[0]
+    
+    video_input.close()
+    
+    # Prefetching is limited so that queued frames are not overwritten
+    frames = [frame.copy() for frame in VideoInput(sample_video_path, frame_buffers=4).get_frames()]
+    assert all(np.array_equal(a, b) for a, b in zip(frames, expected))
+    assert len(frames) == 30
+
+
+def test_video_input_low_latency(sample_video_path):
+    """Test that low latency mode only applies to cameras and streams."""
+    assert VideoInput._is_live_source(0)
+    assert VideoInput._is_live_source("rtsp://camera.local/stream")
+    assert not VideoInput._is_live_source(sample_video_path)
+
+    # Video files open and play normally
+    video_input = VideoInput(sample_video_path, low_latency=True)
+    assert video_input.open()
+    ret, frame = video_input.get_frame()
+    assert ret
+    assert frame.shape == (480, 640, 3)
+    video_input.close()
+
+
+def test_video_input_pyav_backend(sample_video_path):
+    """Test that the PyAV backend yields the same frames as OpenCV."""
+    pytest.importorskip("av")
+
+    expected = list(VideoInput(sample_video_path).get_frames(interval=3))
+    frames = list(VideoInput(sample_video_path, backend="pyav").get_frames(interval=3))
+
+    assert len(frames) == len(expected)
+    for frame, expected_frame in zip(frames, expected):
+        assert frame.shape == expected_frame.shape
+        assert np.abs(frame.astype(np.int16) - expected_frame).max() <= 2
+
+    with pytest.raises(ValueError):
+        VideoInput(sample_video_path, backend="gstreamer")
+
+
+def test_video_input_grab_retrieve(sample_video_path):
+    """Test grabbing frames and converting only the ones that are needed."""
+    video_input = VideoInput(sample_video_path)
+    assert video_input.open()
+    expected = [video_input.get_frame()[1] for _ in range(3)]
+    video_input.close()
+
+    video_input = VideoInput(sample_video_path)
+    assert video_input.open()
+    assert video_input.grab()
+    assert video_input.grab()
+    ret, frame = video_input.retrieve()
+    assert ret
+    assert np.array_equal(frame, expected[1])
+    assert np.array_equal(video_input.get_frame()[1], expected[2])
+    video_input.close()
+
+
+def test_video_input_get_frames_array(sample_video_path):
+    """Test reading frames into a single array."""
+    expected = list(VideoInput(sample_video_path).get_frames(prefetch=0))
+
+    frames = VideoInput(sample_video_path).get_frames_array(40)
+    assert frames.shape == (30, 480, 640, 3)
+    assert np.array_equal(frames, np.stack(expected))
+
+    frames = VideoInput(sample_video_path).get_frames_array(4, interval=7)
+    assert frames.shape == (4, 480, 640, 3)
+    assert np.array_equal(frames, np.stack(expected[:28:7]))
@@ -0,0 +1,83 @@
+"""
+Tests for the Visualizer class.
+"""
+
+import chess
+import numpy as np
+
+from chess_video_analyzer.utils.visualization import Visualizer
+
+
+def test_draw_board_background():
+    """Test that the board is drawn on a checkered background."""
+    visualizer = Visualizer(board_size=400)
+    board_img = visualizer.draw_board(chess.Board(None))
+
+    assert board_img.shape == (400, 400, 3)
+    assert tuple(board_img[25, 25]) == visualizer.white_color
+    assert tuple(board_img[25, 75]) == visualizer.black_color
+    assert tuple(board_img[375, 25]) == visualizer.black_color
+
+    # The cached background is not modified by drawing pieces
+    visualizer.draw_board(chess.Board())
+    assert np.array_equal(visualizer.draw_board(chess.Board(None)), board_img)
+
+
+def test_draw_board_piece_tiles():
+    """Test that pre-rendered piece tiles match drawing the pieces directly."""
+    visualizer = Visualizer(board_size=400)
+    board = chess.Board("r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4")
+    assert visualizer._piece_tiles is not None
+
+    board_img = visualizer.draw_board(board)
+    visualizer._piece_tiles = None
+    assert np.array_equal(visualizer.draw_board(board), board_img)
+
+
+def test_overlays_inplace():
+    """Test that overlays copy the input unless asked to draw in place."""
+    visualizer = Visualizer(board_size=400)
+    board_img = visualizer.draw_board(chess.Board())
+    original = board_img.copy()
+
+    highlighted = visualizer.highlight_square(board_img, chess.E4)
+    assert highlighted is not board_img
+    assert np.array_equal(board_img, original)
+
+    result = visualizer.highlight_square(board_img, chess.E4, inplace=True)
+    assert result is board_img
+    assert np.array_equal(result, highlighted)
+
+
+def test_add_text_overlay_patch():
+    """Test that cached text boxes match drawing the text directly."""
+    visualizer = Visualizer(board_size=400)
+    board_img = visualizer.draw_board(chess.Board())
+    fen = chess.Board().board_fen()
+
+    for position in (None, (10, 30), (-40, 5), (380, 398)):
+        expected = board_img.copy()
+        visualizer._draw_text_box(expected, fen, position or (10, 380))
+
+        result = visualizer.add_text_overlay(board_img, fen, position)
+        assert visualizer._text_patches[fen] is not None
+        assert np.array_equal(result, expected)
+
+
+def test_output_buffers_reused():
+    """Test drawing into caller-provided images of the right shape."""
+    visualizer = Visualizer(board_size=400)
+    board_img = visualizer.draw_board(chess.Board())
+
+    dst = np.full_like(board_img, 7)
+    assert visualizer.draw_board(chess.Board(), dst=dst) is dst
+    assert np.array_equal(dst, board_img)
+
+    frame = np.full((300, 500, 3), 50, dtype=np.uint8)
+    vis_img = visualizer.create_side_by_side(frame, board_img)
+    dst = np.empty_like(vis_img)
+    assert visualizer.create_side_by_side(frame, board_img, dst=dst) is dst
+    assert np.array_equal(dst, vis_img)
+
+    # Buffers of the wrong shape are replaced
+    assert visualizer.create_side_by_side(board_img, board_img, dst=dst).shape == (400, 800, 3)